@@ -0,0 +1,238 @@
+"""Tests covering data model validation helpers."""
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from xihr.data import (
+    HorseEntryModel,
+    LiveDataRepository,
+    PayoffModel,
+    PayoffTable,
+    SimulationDataRepository,
+    to_domain_horse,
+    to_domain_payoff,
+    validate_and_build_horses_from_json,
+    validate_and_build_horses_parallel,
+    validate_and_build_payoffs,
+)
+from xihr.data import repositories
+from xihr.data.models import ModelValidationError
+
+
+def test_horses_from_json_validates_records():
+    """Decode a JSON array of horses and build validated models."""
+
+    payload = json.dumps(
+        [
+            {
+                "race_id": "R1",
+                "horse_id": "H1",
+                "name": "Swift",
+                "jockey": "J",
+                "trainer": "T",
+                "draw": 1,
+                "odds": {"win": 2.5},
+            }
+        ]
+    ).encode()
+
+    horses = validate_and_build_horses_from_json(payload)
+
+    assert [horse.horse_id for horse in horses] == ["H1"]
+    assert horses[0].odds == {"win": 2.5}
+    with pytest.raises(ModelValidationError):
+        validate_and_build_horses_from_json(b'{"race_id": "R1"}')
+
+
+def test_domain_conversion_reuses_identical_instances():
+    """Identical payoff records convert to the same pooled domain object."""
+
+    record = {
+        "race_id": "R1",
+        "bet_type": "win",
+        "combination": "1",
+        "odds": 2.0,
+        "payout": 200.0,
+    }
+    first = to_domain_payoff(PayoffModel.model_validate(record))
+    second = to_domain_payoff(PayoffModel.model_validate(record))
+
+    assert first is second
+
+
+def test_parallel_horse_validation_reports_absolute_indices():
+    """Chunked validation keeps record order and global error indices."""
+
+    records = [
+        {
+            "race_id": "R1",
+            "horse_id": f"H{index}",
+            "name": "Runner",
+            "jockey": "J",
+            "trainer": "T",
+            "draw": index + 1,
+            "odds": {},
+        }
+        for index in range(5)
+    ]
+    horses = validate_and_build_horses_parallel(records, chunk_size=2, workers=2)
+    assert [horse.horse_id for horse in horses] == [f"H{i}" for i in range(5)]
+
+    del records[3]["name"]
+    with pytest.raises(ModelValidationError) as excinfo:
+        validate_and_build_horses_parallel(records, chunk_size=2, workers=2)
+    assert "record 3" in str(excinfo.value.errors[0])
+
+
+def test_payoff_table_round_trips_single_precision_prices():
+    """Payoff tables store prices as float32 and widen them on read."""
+
+    models = [
+        PayoffModel.model_validate(
+            {
+                "race_id": "R1",
+                "bet_type": "win",
+                "combination": "3",
+                "odds": 2.5,
+                "payout": 250.0,
+            }
+        )
+    ]
+    table = PayoffTable.from_models(models)
+
+    assert len(table) == 1
+    assert table.odds.itemsize == 4
+    (payoff,) = table.iter_payoffs()
+    assert payoff.combination == ("3",)
+    assert payoff.odds == 2.5
+    assert isinstance(payoff.payout, float)
+
+
+def test_column_mapping_matches_row_validation():
+    """Column mappings build the same models and errors as row records."""
+
+    rows = [
+        {
+            "race_id": "R1",
+            "bet_type": "win",
+            "combination": "1",
+            "odds": 2.0,
+            "payout": 200,
+        },
+        {
+            "race_id": "R1",
+            "bet_type": "exacta",
+            "combination": ["1", "2"],
+            "odds": 8.0,
+            "payout": 800,
+        },
+    ]
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+
+    assert validate_and_build_payoffs(columns) == validate_and_build_payoffs(rows)
+
+    columns["odds"][1] = -1.0
+    with pytest.raises(ModelValidationError) as excinfo:
+        validate_and_build_payoffs(columns)
+    assert "odds must be positive" in str(excinfo.value.errors[0])
+
+
+def test_domain_horse_is_frozen_with_sorted_odds():
+    """Domain horses are immutable and expose odds as a mapping."""
+
+    horse = to_domain_horse(
+        HorseEntryModel.model_validate(
+            {
+                "race_id": "R1",
+                "horse_id": "H1",
+                "name": "Swift",
+                "jockey": "J",
+                "trainer": "T",
+                "draw": 1,
+                "odds": {"win": 2.5, "place": 1.2},
+            }
+        )
+    )
+
+    assert horse.odds_items == (("place", 1.2), ("win", 2.5))
+    assert horse.odds == {"win": 2.5, "place": 1.2}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        horse.draw = 2  # type: ignore[misc]
+
+
+def test_repository_indexes_payoffs_by_horse():
+    """Payoff lookups by horse honour the optional bet type filter."""
+
+    repository = SimulationDataRepository.from_csv(Path("data/sample"))
+
+    all_payoffs = repository.get_payoffs_for_horse("H001")
+    win_payoffs = repository.get_payoffs_for_horse("H001", "win")
+
+    assert {payoff.bet_type for payoff in all_payoffs} == {"win", "place", "quinella"}
+    assert [payoff.combination for payoff in win_payoffs] == [("H001",)]
+    assert repository.get_payoffs_for_horse("missing") == ()
+
+
+def test_race_membership_uses_horse_ids():
+    """Races answer horse membership without scanning entries."""
+
+    repository = SimulationDataRepository.from_csv(Path("data/sample"))
+    race = repository.get_race("RACE001")
+
+    assert race is not None
+    assert race.horse_ids == {"H001", "H002", "H003"}
+    assert "H002" in race
+    assert "H004" not in race
+
+
+def test_csv_files_load_in_worker_processes(monkeypatch):
+    """Large inputs are loaded per file in workers with identical results."""
+
+    serial = SimulationDataRepository.from_csv(Path("data/sample"))
+    monkeypatch.setattr(repositories, "_PARALLEL_CSV_MIN_BYTES", 0)
+    parallel = SimulationDataRepository.from_csv(Path("data/sample"))
+
+    assert list(parallel.iter_races()) == list(serial.iter_races())
+    assert parallel.get_payoffs("RACE001") == serial.get_payoffs("RACE001")
+
+
+def test_live_payoff_snapshot_refreshes_on_registration():
+    """Live payoff tuples are reused until new payoffs arrive for the race."""
+
+    repository = LiveDataRepository()
+    model = PayoffModel(
+        race_id="R1", bet_type="win", combination="H1", odds=2.0, payout=200
+    )
+    first = to_domain_payoff(model)
+    repository.register_payoff(first)
+    snapshot = repository.get_payoffs("R1")
+
+    assert repository.get_payoffs("R1") is snapshot
+    second = dataclasses.replace(first, bet_type="place")
+    repository.register_payoff(second)
+    assert repository.get_payoffs("R1") == (first, second)
+    assert repository.get_payoffs("missing") == ()
+
+
+def test_csv_cache_is_reused_until_the_source_changes(tmp_path):
+    """Cached columns are served until a CSV file is modified."""
+
+    for source in Path("data/sample").glob("*.csv"):
+        (tmp_path / source.name).write_text(source.read_text(encoding="utf8"))
+    uncached = SimulationDataRepository.from_csv(tmp_path)
+    first = SimulationDataRepository.from_csv(tmp_path, cache=True)
+    second = SimulationDataRepository.from_csv(tmp_path, cache=True)
+
+    assert (tmp_path / "payoffs.csv.cache").exists()
+    assert list(first.iter_races()) == list(uncached.iter_races())
+    assert second.get_payoffs("RACE001") == uncached.get_payoffs("RACE001")
+
+    payoffs = tmp_path / "payoffs.csv"
+    extra_row = "RACE001,exacta,H002-H001,9.0,900\n"
+    payoffs.write_text(payoffs.read_text(encoding="utf8") + extra_row)
+    refreshed = SimulationDataRepository.from_csv(tmp_path, cache=True)
+    expected = len(uncached.get_payoffs("RACE001")) + 1
+    assert len(refreshed.get_payoffs("RACE001")) == expected
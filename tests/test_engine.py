@@ -183,3 +183,13 @@ def test_engine_schedules_payoff_publication():
     expected_first = data_repo.get_publish_time("RACE001", "payoff")
     assert expected_first is not None
     assert payoff_events[0] == expected_first
+
+
+def test_hot_path_events_use_slots():
+    """Events constructed per bet or data publication must not carry a ``__dict__``."""
+
+    from xihr.core.events import BetConfirmationEvent, DataEvent
+
+    for event_cls in (BetConfirmationEvent, DataEvent):
+        assert "__slots__" in vars(event_cls)
+        assert "__dict__" not in vars(event_cls)
@@ -0,0 +1,81 @@
+"""Tests covering execution helpers and betting repositories."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from xihr.data import SimulationDataRepository
+from xihr.execution.broker import LiveBettingRepository, SimulationBettingRepository
+from xihr.execution.router import Throttle, any_throttle_allows
+from xihr.strategy.risk import Portfolio
+
+
+def test_any_throttle_allows_marks_every_allowing_throttle():
+    """All throttles that allow execution record the timestamp."""
+
+    now = datetime(2024, 4, 1, tzinfo=UTC)
+    fast = Throttle(interval=timedelta(seconds=1))
+    slow = Throttle(interval=timedelta(minutes=1))
+
+    assert any_throttle_allows([fast, slow], now)
+    assert fast.last_executed == now
+    assert slow.last_executed == now
+
+    later = now + timedelta(seconds=5)
+    assert any_throttle_allows([fast, slow], later)
+    assert fast.last_executed == later
+    assert slow.last_executed == now
+
+
+@pytest.mark.parametrize(
+    ("bet_type", "horse_ids", "expected"),
+    [
+        ("単勝", ["H001"], 1.9),
+        ("place", ["H003"], 1.0),
+        ("馬連", ["H002", "H001"], 4.2),
+        ("exacta", ["H001", "H002"], 0.0),
+    ],
+)
+def test_simulated_settlement_matches_payoffs(bet_type, horse_ids, expected):
+    """Settlement pays out on aliased and order-insensitive combinations."""
+
+    data = SimulationDataRepository.from_csv(Path("data/sample"))
+    broker = SimulationBettingRepository(Portfolio.create(100.0), data)
+    placed_at = datetime(2024, 4, 1, tzinfo=UTC)
+    broker.confirm_bet(
+        broker.place_bet("RACE001", horse_ids, 10.0, bet_type, placed_at=placed_at)
+    )
+
+    (position,) = broker.settle_race("RACE001")
+    assert position.payout == pytest.approx(10.0 * expected)
+
+
+def test_betting_repository_uses_supplied_clock():
+    """Requests without ``placed_at`` are stamped from the injected clock."""
+
+    moment = datetime(2024, 4, 1, 12, tzinfo=UTC)
+    data = SimulationDataRepository.from_csv(Path("data/sample"))
+    broker = SimulationBettingRepository(
+        Portfolio.create(100.0), data, clock=lambda: moment
+    )
+
+    confirmation = broker.place_bet("RACE001", ["H001"], 10.0, "win")
+    assert confirmation.placed_at == moment
+
+
+def test_live_reservations_never_exceed_bankroll_across_threads():
+    """Concurrent live requests accept exactly as many bets as cash allows."""
+
+    broker = LiveBettingRepository(Portfolio.create(100.0))
+    placed_at = datetime(2024, 4, 1, tzinfo=UTC)
+
+    def request(_: int) -> bool:
+        event = broker.place_bet("RACE001", ["H001"], 10.0, "win", placed_at=placed_at)
+        return event.accepted
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        accepted = sum(executor.map(request, range(40)))
+
+    assert accepted == 10
@@ -0,0 +1,74 @@
+"""Tests covering portfolio and strategy rule helpers."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from xihr.strategy.risk import Portfolio
+from xihr.strategy.rules import limit_open_positions
+
+
+def test_portfolio_tracks_running_totals():
+    """Open and settled views and profit follow each placement and settlement."""
+
+    portfolio = Portfolio.create(1_000.0)
+    placed_at = datetime(2024, 4, 1, tzinfo=UTC)
+    for bet_id, stake in (("a", 100.0), ("b", 50.0)):
+        portfolio.place_bet(
+            bet_id=bet_id,
+            race_id="RACE001",
+            bet_type="win",
+            combination=["H001"],
+            stake=stake,
+            placed_at=placed_at,
+        )
+
+    assert portfolio.total_profit() == pytest.approx(-150.0)
+    assert [pos.bet_id for pos in portfolio.positions_for_race("RACE001")] == ["a", "b"]
+    assert portfolio.positions_for_race("RACE002") == []
+    portfolio.settle_bet("a", 250.0)
+
+    assert [pos.bet_id for pos in portfolio.open_positions()] == ["b"]
+    assert [pos.bet_id for pos in portfolio.settled_positions()] == ["a"]
+    assert portfolio.total_profit() == pytest.approx(100.0)
+    assert portfolio.cash == pytest.approx(1_100.0)
+
+
+def test_portfolio_status_change_leaves_open_totals():
+    """Positions moved out of ``open`` no longer count as open stake."""
+
+    portfolio = Portfolio.create(100.0)
+    portfolio.place_bet(
+        bet_id="a",
+        race_id="RACE001",
+        bet_type="win",
+        combination=["H001"],
+        stake=40.0,
+        placed_at=datetime(2024, 4, 1, tzinfo=UTC),
+    )
+    portfolio.set_status("a", "submitted")
+
+    assert portfolio.open_positions() == []
+    assert portfolio.total_profit() == 0.0
+
+
+def test_limit_open_positions_accepts_portfolio_or_positions():
+    """The rule gives the same answer for a portfolio and its positions."""
+
+    portfolio = Portfolio.create(100.0)
+    for bet_id in ("a", "b"):
+        portfolio.place_bet(
+            bet_id=bet_id,
+            race_id="RACE001",
+            bet_type="win",
+            combination=["H001"],
+            stake=10.0,
+            placed_at=datetime(2024, 4, 1, tzinfo=UTC),
+        )
+    portfolio.settle_bet("a", 0.0)
+
+    assert portfolio.open_count == 1
+    for max_open in (0, 1, 2):
+        expected = 1 < max_open
+        assert limit_open_positions(portfolio, max_open) is expected
+        assert limit_open_positions(portfolio.positions.values(), max_open) is expected
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List
 
-from ..strategy.risk import BetPosition
+from ..strategy.risk import BetPosition, BetStatus
 
 
 @dataclass(slots=True)
@@ -35,23 +35,36 @@ class KPIReport:
 def generate_report(positions: Iterable[BetPosition]) -> KPIReport:
     """Aggregate the provided positions into a :class:`KPIReport`."""
 
-    position_list = list(positions)
-    total_bets = len(position_list)
+    total_bets = 0
+    profits: List[float] = []
+    wins: List[bool] = []
+    total_profit = 0.0
+    total_stake = 0.0
+    total_payout = 0.0
+    win_count = 0
+    # Gather every settled-bet aggregate in a single pass over the positions.
+    for pos in positions:
+        total_bets += 1
+        if pos.status != BetStatus.SETTLED:
+            continue
+        profit = pos.payout - pos.stake
+        won = pos.payout > pos.stake
+        profits.append(profit)
+        wins.append(won)
+        total_profit += profit
+        total_stake += pos.stake
+        total_payout += pos.payout
+        win_count += won
     if total_bets == 0:
         return KPIReport(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0)
 
-    settled = [pos for pos in position_list if pos.status == "settled"]
-    settled_bets = len(settled)
+    settled_bets = len(profits)
     if settled_bets == 0:
         return KPIReport(total_bets, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0)
 
-    profits = [pos.payout - pos.stake for pos in settled]
-    total_profit = sum(profits)
-    total_stake = sum(pos.stake for pos in settled)
     roi = total_profit / total_stake if total_stake else 0.0
-    wins = [pos.payout > pos.stake for pos in settled]
-    win_rate = sum(1 for won in wins if won) / settled_bets
-    avg_payout = sum(pos.payout for pos in settled) / settled_bets
+    win_rate = win_count / settled_bets
+    avg_payout = total_payout / settled_bets
     max_drawdown = _calculate_drawdown(profits)
     max_win, max_loss = _streaks(wins)
 
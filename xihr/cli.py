@@ -2,11 +2,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Type
+from typing import TYPE_CHECKING, Any, Dict, Type
 
-import pandas as pd
 import typer
-import yaml
 
 from .backtest.metrics import generate_report
 from .config import AppSettings, load_settings
@@ -19,9 +17,12 @@ from .execution.broker import (
     LiveBettingRepository,
     SimulationBettingRepository,
 )
-from .strategy import BaseStrategy, Portfolio
+from .strategy import BaseStrategy, BetStatus, Portfolio
 from strategies import NaiveFavoriteStrategy, ValueBettingStrategy
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 app = typer.Typer(help="Japanese horse racing betting simulator")
 
 STRATEGIES: Dict[str, Type[BaseStrategy]] = {
@@ -79,6 +80,8 @@ def run(
 def report(*, bets: Path = typer.Option(..., exists=True, help="CSV bet history")) -> None:
     """Generate analytics for a saved bet history."""
 
+    import pandas as pd
+
     df = pd.read_csv(bets)
     positions = [
         portfolio_row_to_position(row)
@@ -152,6 +155,8 @@ def _load_config(config_path: Path | None) -> AppSettings:
 
     overrides: Dict[str, Any] = {}
     if config_path:
+        import yaml
+
         with config_path.open("r", encoding="utf8") as fh:
             overrides = yaml.safe_load(fh) or {}
     return load_settings(**overrides)
@@ -160,6 +165,8 @@ def _load_config(config_path: Path | None) -> AppSettings:
 def _write_positions(path: Path, positions) -> None:
     """Persist portfolio positions to ``path`` as CSV."""
 
+    import pandas as pd
+
     records = [
         {
             "bet_id": pos.bet_id,
@@ -168,7 +175,7 @@ def _write_positions(path: Path, positions) -> None:
             "combination": "-".join(pos.combination),
             "stake": pos.stake,
             "payout": pos.payout,
-            "status": pos.status,
+            "status": BetStatus(pos.status).value,
         }
         for pos in positions
     ]
@@ -178,7 +185,7 @@ def _write_positions(path: Path, positions) -> None:
 def portfolio_row_to_position(row: pd.Series):
     """Convert a CSV row into a :class:`~xihr.strategy.BetPosition`."""
 
-    from xihr.strategy import BetPosition
+    from xihr.strategy import BetPosition, BetStatus
     from datetime import UTC, datetime
 
     combination_raw = str(row.get("combination", ""))
@@ -190,6 +197,6 @@ def portfolio_row_to_position(row: pd.Series):
         combination=combo,
         stake=float(row["stake"]),
         placed_at=datetime.now(UTC),
-        status=str(row.get("status", "settled")),
+        status=BetStatus(str(row.get("status", "settled"))),
         payout=float(row.get("payout", 0.0)),
     )
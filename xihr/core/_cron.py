@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import importlib
+import importlib.util
 from datetime import datetime, timedelta
 from typing import Any, Callable, Optional
 
@@ -73,7 +73,10 @@ class SimulatedClock(Clock):
 def _ensure_utc(moment: datetime) -> datetime:
     """Return a timezone-aware UTC datetime."""
 
-    if moment.tzinfo is None:
+    tz = moment.tzinfo
+    if tz is UTC:
+        return moment
+    if tz is None:
         return moment.replace(tzinfo=UTC)
     return moment.astimezone(UTC)
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime, time, timedelta
 from inspect import signature
 from itertools import count
-from typing import Callable, Iterable, List, Literal, Sequence
+from typing import Any, Callable, Iterable, List, Literal, Sequence
 
 from ._cron import croniter
 
@@ -25,6 +25,9 @@ from ..execution.broker import BettingRepository
 EventType = BetConfirmationEvent | BetRequestEvent | DataEvent | ResultEvent | TimeEvent
 """Union of all event variants processed by the engine."""
 
+_EventHandler = Callable[["BaseStrategy", Any, datetime], None]
+"""Signature of the per-event-type handlers used by :class:`Engine`."""
+
 
 @dataclass(slots=True)
 class ScheduleEntry:
@@ -159,6 +162,14 @@ class Engine:
         self._races: list[Race] = []
         self._timeline_end: datetime | None = None
         self._running = False
+        self._event_handlers: dict[type, _EventHandler] = {
+            TimeEvent: self._handle_time,
+            DataEvent: self._handle_data,
+            BetRequestEvent: self._handle_bet_request,
+            BetConfirmationEvent: self._handle_bet_confirmation,
+            ResultEvent: self._handle_result,
+        }
+        """Event handlers keyed by exact event class for O(1) dispatch."""
 
     def schedule(
         self,
@@ -293,65 +304,106 @@ class Engine:
     def _process_events(self, strategy: "BaseStrategy") -> None:
         """Process events until the queue is exhausted."""
 
+        handlers = self._event_handlers
         while self._event_queue:
             scheduled_for, _, event = heapq.heappop(self._event_queue)
             scheduled_for = _ensure_utc(scheduled_for)
-            if isinstance(event, TimeEvent):
-                self._next_tick_time = None
-                event.scheduled_for = scheduled_for
-                self.clock.advance_to(scheduled_for)
-                strategy.on_time(event)
-                self._run_due_schedules(strategy, scheduled_for)
-                self._schedule_next_tick()
-            elif isinstance(event, DataEvent):
-                event.available_at = scheduled_for
-                self.clock.advance_to(event.available_at)
-                if event.kind == "payoff":
-                    payoffs = tuple(
-                        self.data_repository.get_payoffs(event.race.race_id)
+            handler = handlers.get(type(event))
+            if handler is None:
+                handler = self._resolve_handler(event)
+            handler(strategy, event, scheduled_for)
+
+    def _resolve_handler(self, event: EventType) -> _EventHandler:
+        """Find and cache the handler for an event subclass."""
+
+        for event_cls, handler in list(self._event_handlers.items()):
+            if isinstance(event, event_cls):
+                self._event_handlers[type(event)] = handler
+                return handler
+        msg = f"Unsupported event type: {type(event)!r}"
+        raise TypeError(msg)
+
+    def _handle_time(
+        self, strategy: "BaseStrategy", event: TimeEvent, scheduled_for: datetime
+    ) -> None:
+        """Advance the clock for a tick and fire any due schedules."""
+
+        self._next_tick_time = None
+        event.scheduled_for = scheduled_for
+        self.clock.advance_to(scheduled_for)
+        strategy.on_time(event)
+        self._run_due_schedules(strategy, scheduled_for)
+        self._schedule_next_tick()
+
+    def _handle_data(
+        self, strategy: "BaseStrategy", event: DataEvent, scheduled_for: datetime
+    ) -> None:
+        """Publish race or payoff data and settle bets once payoffs arrive."""
+
+        event.available_at = scheduled_for
+        self.clock.advance_to(event.available_at)
+        if event.kind == "payoff":
+            payoffs = tuple(self.data_repository.get_payoffs(event.race.race_id))
+            event.payoffs = payoffs
+        strategy.on_data(event)
+        if event.kind == "payoff":
+            settled = self.betting_repository.settle_race(event.race.race_id)
+            if settled:
+                self._enqueue(
+                    ResultEvent(
+                        race_id=event.race.race_id,
+                        settled_at=self.clock.now(),
+                    )
+                )
+
+    def _handle_bet_request(
+        self, strategy: "BaseStrategy", event: BetRequestEvent, scheduled_for: datetime
+    ) -> None:
+        """Forward a bet request to the betting repository."""
+
+        event.placed_at = scheduled_for
+        self.clock.advance_to(event.placed_at)
+        confirmation = self.betting_repository.place_bet(
+            race_id=event.race_id,
+            horse_ids=event.combination,
+            stake=event.stake,
+            bet_type=event.bet_type,
+            placed_at=event.placed_at,
+        )
+        if confirmation is not None:
+            self._enqueue_front(confirmation)
+
+    def _handle_bet_confirmation(
+        self,
+        strategy: "BaseStrategy",
+        event: BetConfirmationEvent,
+        scheduled_for: datetime,
+    ) -> None:
+        """Confirm accepted bets and notify the strategy."""
+
+        event.placed_at = scheduled_for
+        self.clock.advance_to(event.placed_at)
+        if event.accepted:
+            position = self.betting_repository.confirm_bet(event)
+            event.position = position
+            settled = self.betting_repository.settle_race(event.race_id)
+            if settled:
+                self._enqueue(
+                    ResultEvent(
+                        race_id=event.race_id,
+                        settled_at=self.clock.now(),
                     )
-                    event.payoffs = payoffs
-                strategy.on_data(event)
-                if event.kind == "payoff":
-                    settled = self.betting_repository.settle_race(event.race.race_id)
-                    if settled:
-                        self._enqueue(
-                            ResultEvent(
-                                race_id=event.race.race_id,
-                                settled_at=self.clock.now(),
-                            )
-                        )
-            elif isinstance(event, BetRequestEvent):
-                event.placed_at = scheduled_for
-                self.clock.advance_to(event.placed_at)
-                confirmation = self.betting_repository.place_bet(
-                    race_id=event.race_id,
-                    horse_ids=event.combination,
-                    stake=event.stake,
-                    bet_type=event.bet_type,
-                    placed_at=event.placed_at,
                 )
-                if confirmation is not None:
-                    self._enqueue_front(confirmation)
-            elif isinstance(event, BetConfirmationEvent):
-                event.placed_at = scheduled_for
-                self.clock.advance_to(event.placed_at)
-                if event.accepted:
-                    position = self.betting_repository.confirm_bet(event)
-                    event.position = position
-                    settled = self.betting_repository.settle_race(event.race_id)
-                    if settled:
-                        self._enqueue(
-                            ResultEvent(
-                                race_id=event.race_id,
-                                settled_at=self.clock.now(),
-                            )
-                        )
-                strategy.on_bet(event)
-            elif isinstance(event, ResultEvent):
-                event.settled_at = scheduled_for
-                self.clock.advance_to(event.settled_at)
-                strategy.on_result(event)
+        strategy.on_bet(event)
+
+    def _handle_result(
+        self, strategy: "BaseStrategy", event: ResultEvent, scheduled_for: datetime
+    ) -> None:
+        """Deliver a settled race result to the strategy."""
+
+        event.settled_at = scheduled_for
+        self.clock.advance_to(event.settled_at)
+        strategy.on_result(event)
 
     def _run_due_schedules(self, strategy: "BaseStrategy", current_time: datetime) -> None:
         """Invoke any schedules that are due at the provided time."""
@@ -446,7 +498,10 @@ def _sorted_races(races: Iterable[Race]) -> List[Race]:
 def _ensure_utc(moment: datetime) -> datetime:
     """Normalize datetimes to explicit UTC timezone objects."""
 
-    if moment.tzinfo is None:
+    tz = moment.tzinfo
+    if tz is UTC:
+        return moment
+    if tz is None:
         return moment.replace(tzinfo=UTC)
     return moment.astimezone(UTC)
 
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal, Sequence
+from typing import TYPE_CHECKING, Literal, Sequence
 
 from ..data.models import Payoff, Race
-from ..strategy.risk import BetPosition
+
+if TYPE_CHECKING:  # pragma: no cover - import only for typing
+    from ..strategy.risk import BetPosition
 
 
 @dataclass(slots=True)
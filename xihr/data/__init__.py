@@ -8,12 +8,16 @@ from .models import (
     HorseEntryModel,
     Payoff,
     PayoffModel,
+    PayoffTable,
     Race,
     RaceModel,
     to_domain_horse,
     to_domain_payoff,
     to_domain_race,
     validate_and_build_horses,
+    validate_and_build_horses_from_json,
+    validate_and_build_horses_parallel,
+    validate_and_build_horses_stream,
     validate_and_build_payoffs,
     validate_and_build_races,
 )
@@ -27,6 +31,7 @@ __all__ = [
     "HorseEntryModel",
     "RaceModel",
     "PayoffModel",
+    "PayoffTable",
     "HORSE_ENTRY_SCHEMA",
     "RACE_SCHEMA",
     "PAYOFF_SCHEMA",
@@ -37,6 +42,9 @@ __all__ = [
     "to_domain_race",
     "to_domain_payoff",
     "validate_and_build_horses",
+    "validate_and_build_horses_from_json",
+    "validate_and_build_horses_parallel",
+    "validate_and_build_horses_stream",
     "validate_and_build_races",
     "validate_and_build_payoffs",
     "DataRepository",
@@ -2,16 +2,63 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
-from dataclasses import dataclass
+import sys
+from array import array
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from weakref import WeakValueDictionary
+
+_T = TypeVar("_T")
 
 
 class ValidationError(ValueError):
     """Raised when a record fails validation."""
 
 
+def _parse_odds(raw_odds: object) -> Dict[str, float]:
+    """Validate a horse odds mapping, decoding JSON strings when necessary."""
+
+    if isinstance(raw_odds, str) and raw_odds:
+        raw_odds = json.loads(raw_odds)
+    if not isinstance(raw_odds, Mapping):
+        raise ValidationError("Horse odds must be a mapping of bet type to price")
+    odds: Dict[str, float] = {}
+    for bet_type, value in raw_odds.items():
+        price = float(value)
+        if price <= 0:
+            raise ValidationError(f"Odds for {bet_type} must be positive, got {price}")
+        odds[str(bet_type)] = price
+    return odds
+
+
+_HorseT = TypeVar("_HorseT", "HorseEntryModel", "HorseEntry")
+
+
+def _index_horses(horses: Iterable[_HorseT]) -> Dict[str, _HorseT]:
+    """Map horse identifiers to entries, keeping the first entry for each id."""
+
+    index: Dict[str, _HorseT] = {}
+    for horse in horses:
+        index.setdefault(horse.horse_id, horse)
+    return index
+
+
 @dataclass(slots=True)
 class HorseEntryModel:
     """Model representing a horse participating in a race."""
@@ -40,16 +87,7 @@ class HorseEntryModel:
             raise ValidationError(f"Missing horse field: {exc.args[0]}") from exc
         if draw < 1:
             raise ValidationError(f"Horse draw must be >= 1, got {draw}")
-        if isinstance(raw_odds, str) and raw_odds:
-            raw_odds = json.loads(raw_odds)
-        if not isinstance(raw_odds, Mapping):
-            raise ValidationError("Horse odds must be a mapping of bet type to price")
-        odds: Dict[str, float] = {}
-        for bet_type, value in raw_odds.items():
-            price = float(value)
-            if price <= 0:
-                raise ValidationError(f"Odds for {bet_type} must be positive, got {price}")
-            odds[str(bet_type)] = price
+        odds = _parse_odds(raw_odds)
         return cls(
             race_id=race_id,
             horse_id=horse_id,
@@ -77,6 +115,13 @@ class RaceModel:
     ground: str
     weather: str
     horses: List[HorseEntryModel]
+    _horse_by_id: Dict[str, HorseEntryModel] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Index of ``horses`` by identifier, keeping the first entry per id."""
+
+    def __post_init__(self) -> None:
+        self._horse_by_id = _index_horses(self.horses)
 
     @classmethod
     def model_validate(cls, payload: Mapping[str, Any]) -> "RaceModel":
@@ -116,7 +161,46 @@ class RaceModel:
     def get_horse(self, horse_id: str) -> HorseEntryModel | None:
         """Return the horse with the given identifier if present."""
 
-        return next((horse for horse in self.horses if horse.horse_id == horse_id), None)
+        return self._horse_by_id.get(horse_id)
+
+
+def _parse_combination_string(raw: str) -> Tuple[str, ...]:
+    """Split a ``"1-2-3"`` style combination into runner identifiers."""
+
+    return tuple([part for part in raw.split("-") if part])
+
+
+def _parse_combination_sequence(raw: Sequence[Any]) -> Tuple[str, ...]:
+    """Normalise a sequence combination into a tuple of runner identifiers."""
+
+    return tuple([str(part) for part in raw])
+
+
+_COMBINATION_PARSERS: Dict[type, Callable[[Any], Tuple[str, ...]]] = {
+    str: _parse_combination_string,
+    list: _parse_combination_sequence,
+    tuple: _parse_combination_sequence,
+}
+"""Combination parsers keyed by the exact type of the raw value."""
+
+
+def _combination_parser_for_subclass(raw: object) -> Callable[[Any], Tuple[str, ...]]:
+    """Resolve a parser for subclasses of the supported combination types."""
+
+    if isinstance(raw, str):
+        return _parse_combination_string
+    if isinstance(raw, (list, tuple)):
+        return _parse_combination_sequence
+    raise ValidationError("Payoff combination must be a string or sequence")
+
+
+def _parse_combination(raw: object) -> Tuple[str, ...]:
+    """Parse a raw payoff combination into a tuple of runner identifiers."""
+
+    parser = _COMBINATION_PARSERS.get(type(raw))
+    if parser is None:
+        parser = _combination_parser_for_subclass(raw)
+    return parser(raw)
 
 
 @dataclass(slots=True)
@@ -145,12 +229,7 @@ class PayoffModel:
             raise ValidationError("Payoff odds must be positive")
         if payout < 0:
             raise ValidationError("Payoff payout must be non-negative")
-        if isinstance(combination_raw, str):
-            combination = tuple(part for part in combination_raw.split("-") if part)
-        elif isinstance(combination_raw, (list, tuple)):
-            combination = tuple(str(part) for part in combination_raw)
-        else:
-            raise ValidationError("Payoff combination must be a string or sequence")
+        combination = _parse_combination(combination_raw)
         return cls(
             race_id=race_id,
             bet_type=bet_type,
@@ -160,6 +239,10 @@ class PayoffModel:
         )
 
 
+ColumnData = Mapping[str, Sequence[Any]]
+"""Column-oriented table mapping field names to equally sized value sequences."""
+
+
 HORSE_ENTRY_SCHEMA = (
     "race_id",
     "horse_id",
@@ -193,7 +276,7 @@ PAYOFF_SCHEMA = (
 """Field names expected in payoff records."""
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class HorseEntry:
     """Runtime representation of a horse entry."""
 
@@ -203,10 +286,17 @@ class HorseEntry:
     jockey: str
     trainer: str
     draw: int
-    odds: Dict[str, float]
+    odds_items: Tuple[Tuple[str, float], ...]
+    """Odds as ``(bet_type, price)`` pairs sorted by bet type."""
 
+    @property
+    def odds(self) -> Dict[str, float]:
+        """Return the odds as a fresh mapping of bet type to price."""
 
-@dataclass(slots=True)
+        return dict(self.odds_items)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Race:
     """Runtime representation of a race."""
 
@@ -217,14 +307,38 @@ class Race:
     ground: str
     weather: str
     horses: Tuple[HorseEntry, ...]
+    _horse_by_id: Dict[str, HorseEntry] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Index of ``horses`` by identifier, keeping the first entry per id."""
+    _horse_ids: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    """Identifiers of every horse running in the race."""
+
+    def __post_init__(self) -> None:
+        horse_by_id = _index_horses(self.horses)
+        object.__setattr__(self, "_horse_by_id", horse_by_id)
+        object.__setattr__(self, "_horse_ids", frozenset(horse_by_id))
+
+    def __contains__(self, horse_id: object) -> bool:
+        """Return whether a horse with ``horse_id`` runs in the race."""
+
+        return horse_id in self._horse_ids
+
+    @property
+    def horse_ids(self) -> frozenset[str]:
+        """Return the identifiers of every horse running in the race."""
+
+        return self._horse_ids
 
     def get_horse(self, horse_id: str) -> HorseEntry | None:
         """Return the horse with the given identifier if present."""
 
-        return next((horse for horse in self.horses if horse.horse_id == horse_id), None)
+        return self._horse_by_id.get(horse_id)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Payoff:
     """Runtime representation of a race payoff."""
 
@@ -235,47 +349,215 @@ class Payoff:
     payout: float
 
 
+def _fast_constructor(cls: type[_T]) -> Callable[..., _T]:
+    """Generate a positional constructor for a slotted dataclass ``cls``.
+
+    The generated function allocates with ``object.__new__`` and stores each
+    init field through its slot descriptor, bypassing the frozen dataclass
+    ``__init__`` and its ``object.__setattr__`` calls. Fields excluded from
+    ``__init__`` receive their defaults and ``__post_init__`` runs last.
+    """
+
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    params: list[str] = []
+    body = ["    obj = _new(_cls)"]
+    for spec in fields(cls):  # type: ignore[arg-type]
+        namespace[f"_set_{spec.name}"] = cls.__dict__[spec.name].__set__
+        if spec.init:
+            params.append(spec.name)
+            body.append(f"    _set_{spec.name}(obj, {spec.name})")
+        elif spec.default_factory is not MISSING:
+            namespace[f"_factory_{spec.name}"] = spec.default_factory
+            body.append(f"    _set_{spec.name}(obj, _factory_{spec.name}())")
+        elif spec.default is not MISSING:
+            namespace[f"_default_{spec.name}"] = spec.default
+            body.append(f"    _set_{spec.name}(obj, _default_{spec.name})")
+    if hasattr(cls, "__post_init__"):
+        body.append("    obj.__post_init__()")
+    body.append("    return obj")
+    source = f"def _make({', '.join(params)}):\n" + "\n".join(body) + "\n"
+    exec(source, namespace)  # noqa: S102 - source is built from field names only
+    return namespace["_make"]  # type: ignore[no-any-return]
+
+
+_make_horse = _fast_constructor(HorseEntry)
+"""Positional fast constructor for :class:`HorseEntry`."""
+
+_make_race = _fast_constructor(Race)
+"""Positional fast constructor for :class:`Race`."""
+
+_make_payoff = _fast_constructor(Payoff)
+"""Positional fast constructor for :class:`Payoff`."""
+
+
+_horse_pool: WeakValueDictionary[Hashable, HorseEntry] = WeakValueDictionary()
+"""Intern pool of live :class:`HorseEntry` instances keyed by their field values."""
+
+_race_pool: WeakValueDictionary[Hashable, Race] = WeakValueDictionary()
+"""Intern pool of live :class:`Race` instances keyed by their field values."""
+
+_payoff_pool: WeakValueDictionary[Hashable, Payoff] = WeakValueDictionary()
+"""Intern pool of live :class:`Payoff` instances keyed by their field values."""
+
+
+def _intern(
+    pool: WeakValueDictionary[Hashable, _T], key: Hashable, factory: Callable[[], _T]
+) -> _T:
+    """Return the pooled instance for ``key``, building it on a miss."""
+
+    instance = pool.get(key)
+    if instance is None:
+        instance = factory()
+        pool[key] = instance
+    return instance
+
+
+def _horse_key(model: HorseEntryModel) -> Hashable:
+    """Return the intern pool key for a horse model."""
+
+    return (
+        model.race_id,
+        model.horse_id,
+        model.name,
+        model.jockey,
+        model.trainer,
+        model.draw,
+        _odds_items(model.odds),
+    )
+
+
+def _odds_items(odds: Mapping[str, float]) -> Tuple[Tuple[str, float], ...]:
+    """Return odds as sorted ``(bet_type, price)`` pairs with interned bet types."""
+
+    items = [(sys.intern(bet_type), price) for bet_type, price in odds.items()]
+    return tuple(sorted(items))
+
+
 def to_domain_horse(model: HorseEntryModel) -> HorseEntry:
-    """Convert a :class:`HorseEntryModel` into its dataclass representation."""
-
-    return HorseEntry(
-        race_id=model.race_id,
-        horse_id=model.horse_id,
-        name=model.name,
-        jockey=model.jockey,
-        trainer=model.trainer,
-        draw=model.draw,
-        odds=dict(model.odds),
+    """Convert a :class:`HorseEntryModel` into its dataclass representation.
+
+    Identical records share a single pooled instance while any reference to it
+    is alive, so domain objects must be treated as read-only.
+    """
+
+    key = _horse_key(model)
+    return _intern(
+        _horse_pool,
+        key,
+        lambda: _make_horse(
+            sys.intern(model.race_id),
+            sys.intern(model.horse_id),
+            model.name,
+            model.jockey,
+            model.trainer,
+            model.draw,
+            key[-1],
+        ),
     )
 
 
 def to_domain_race(model: RaceModel) -> Race:
-    """Convert a :class:`RaceModel` into its dataclass representation."""
-
-    horses = tuple(to_domain_horse(horse) for horse in model.horses)
-    return Race(
-        race_id=model.race_id,
-        date=model.date,
-        course=model.course,
-        distance=model.distance,
-        ground=model.ground,
-        weather=model.weather,
-        horses=horses,
+    """Convert a :class:`RaceModel` into its pooled dataclass representation.
+
+    Identifiers and categorical strings are interned so the repositories keyed
+    on them share one string object per value.
+    """
+
+    key = (
+        model.race_id,
+        model.date,
+        model.course,
+        model.distance,
+        model.ground,
+        model.weather,
+        tuple([_horse_key(horse) for horse in model.horses]),
     )
 
+    def build() -> Race:
+        horses = tuple([to_domain_horse(horse) for horse in model.horses])
+        return _make_race(
+            sys.intern(model.race_id),
+            model.date,
+            sys.intern(model.course),
+            model.distance,
+            sys.intern(model.ground),
+            sys.intern(model.weather),
+            horses,
+        )
+
+    return _intern(_race_pool, key, build)
+
 
 def to_domain_payoff(model: PayoffModel) -> Payoff:
-    """Convert a :class:`PayoffModel` into its dataclass representation."""
-
-    return Payoff(
-        race_id=model.race_id,
-        bet_type=model.bet_type,
-        combination=tuple(model.combination),
-        odds=model.odds,
-        payout=model.payout,
+    """Convert a :class:`PayoffModel` into its pooled dataclass representation."""
+
+    combination = tuple(map(sys.intern, model.combination))
+    key = (model.race_id, model.bet_type, combination, model.odds, model.payout)
+    return _intern(
+        _payoff_pool,
+        key,
+        lambda: _make_payoff(
+            sys.intern(model.race_id),
+            sys.intern(model.bet_type),
+            combination,
+            model.odds,
+            model.payout,
+        ),
     )
 
 
+@dataclass(slots=True)
+class PayoffTable:
+    """Columnar batch of payoffs storing prices as packed 32-bit floats.
+
+    Odds and payouts are held in :class:`array.array` buffers of C ``float``,
+    halving their footprint compared with boxed Python floats. Values widen
+    back to Python (64-bit) floats when read, so arithmetic stays in double
+    precision while stored prices carry single-precision rounding.
+    """
+
+    race_ids: List[str] = field(default_factory=list)
+    """Race identifier for each row."""
+    bet_types: List[str] = field(default_factory=list)
+    """Bet type for each row."""
+    combinations: List[Tuple[str, ...]] = field(default_factory=list)
+    """Runner combination for each row."""
+    odds: array[float] = field(default_factory=lambda: array("f"))
+    """Single-precision odds for each row."""
+    payouts: array[float] = field(default_factory=lambda: array("f"))
+    """Single-precision payout for each row."""
+
+    @classmethod
+    def from_models(cls, models: Iterable[PayoffModel]) -> "PayoffTable":
+        """Build a table from validated payoff models."""
+
+        table = cls()
+        for model in models:
+            table.race_ids.append(model.race_id)
+            table.bet_types.append(model.bet_type)
+            table.combinations.append(tuple(model.combination))
+            table.odds.append(model.odds)
+            table.payouts.append(model.payout)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.race_ids)
+
+    def iter_payoffs(self) -> Iterator[Payoff]:
+        """Yield each row as a :class:`Payoff` dataclass."""
+
+        for race_id, bet_type, combination, odds, payout in zip(
+            self.race_ids, self.bet_types, self.combinations, self.odds, self.payouts
+        ):
+            yield Payoff(
+                race_id=race_id,
+                bet_type=bet_type,
+                combination=combination,
+                odds=odds,
+                payout=payout,
+            )
+
+
 class ModelValidationError(RuntimeError):
     """Raised when incoming tabular data does not conform to the expected shape."""
 
@@ -287,78 +569,311 @@ class ModelValidationError(RuntimeError):
         self.errors = list(errors or [])
 
 
+def _json_loads(buffer: bytes | str) -> Any:
+    """Decode ``buffer`` with ``orjson`` when available, falling back to :mod:`json`."""
+
+    if importlib.util.find_spec("orjson") is not None:
+        return importlib.import_module("orjson").loads(buffer)
+    return json.loads(buffer)
+
+
+def _require_ijson() -> Any:
+    """Return the ijson module if available or raise a helpful error."""
+
+    spec = importlib.util.find_spec("ijson")
+    if spec is None:  # pragma: no cover - optional dependency missing
+        raise RuntimeError("ijson is required for streaming JSON validation")
+    return importlib.import_module("ijson")
+
+
 def _missing_fields(record: Mapping[str, Any], required: Sequence[str]) -> list[str]:
     """Return missing fields for ``record`` given ``required`` names."""
 
-    return [field for field in required if field not in record]
+    return [name for name in required if name not in record]
 
 
-def validate_and_build_horses(data: Iterable[Mapping[str, Any]]) -> List[HorseEntryModel]:
-    """Validate horse records and return Pydantic-style models."""
+def _validate_and_build(
+    records: Iterable[Mapping[str, Any]],
+    schema: Sequence[str],
+    build: Callable[[Mapping[str, Any]], _T],
+    label: str,
+    prepare: Callable[[Mapping[str, Any]], Mapping[str, Any]] | None = None,
+    *,
+    start: int = 0,
+) -> List[_T]:
+    """Validate ``records`` against ``schema`` and build models with ``build``.
+
+    Records are read without copying; ``prepare`` may return an enriched view
+    of each record after the schema check. All failures are collected and
+    raised together as a :class:`ModelValidationError`. ``start`` offsets the
+    record index reported in error messages.
+    """
 
     errors: list[Exception] = []
-    horses: list[HorseEntryModel] = []
-    for index, record in enumerate(data):
-        payload = dict(record)
-        missing = _missing_fields(payload, HORSE_ENTRY_SCHEMA)
+    models: list[_T] = []
+    for index, record in enumerate(records, start):
+        missing = _missing_fields(record, schema)
         if missing:
-            errors.append(ValueError(f"Horse record {index} missing fields: {', '.join(missing)}"))
+            fields_text = ", ".join(missing)
+            errors.append(
+                ValueError(f"{label} record {index} missing fields: {fields_text}")
+            )
             continue
+        payload = record if prepare is None else prepare(record)
         try:
-            horses.append(HorseEntryModel.model_validate(payload))
+            models.append(build(payload))
         except ValidationError as exc:
             errors.append(exc)
+    if errors:
+        raise ModelValidationError(f"Invalid {label.lower()} data", errors=errors)
+    return models
+
+
+def _columns_complete(columns: ColumnData, schema: Sequence[str]) -> bool:
+    """Return whether ``columns`` holds every ``schema`` column at equal lengths."""
+
+    if any(name not in columns for name in schema):
+        return False
+    return len({len(column) for column in columns.values()}) <= 1
+
+
+def _column_records(columns: ColumnData) -> Iterator[Dict[str, Any]]:
+    """Yield row dictionaries from a column mapping."""
+
+    names = list(columns)
+    for row in zip(*(columns[name] for name in names)):
+        yield dict(zip(names, row))
+
+
+def _horses_from_columns(columns: ColumnData) -> List[HorseEntryModel] | None:
+    """Build horse models column by column, or ``None`` if any check fails."""
+
+    if not _columns_complete(columns, HORSE_ENTRY_SCHEMA):
+        return None
+    try:
+        draws = list(map(int, columns["draw"]))
+        if min(draws, default=1) < 1:
+            return None
+        odds = list(map(_parse_odds, columns["odds"]))
+    except (TypeError, ValueError):
+        return None
+    return [
+        HorseEntryModel(*row)
+        for row in zip(
+            map(str, columns["race_id"]),
+            map(str, columns["horse_id"]),
+            map(str, columns["name"]),
+            map(str, columns["jockey"]),
+            map(str, columns["trainer"]),
+            draws,
+            odds,
+        )
+    ]
+
+
+def _races_from_columns(
+    columns: ColumnData, race_to_horses: Mapping[str, List[HorseEntryModel]]
+) -> List[RaceModel] | None:
+    """Build race models column by column, or ``None`` if any check fails."""
+
+    if not _columns_complete(columns, RACE_SCHEMA) or "horses" in columns:
+        return None
+    try:
+        distances = list(map(int, columns["distance"]))
+        if min(distances, default=1) <= 0:
+            return None
+        dates = [
+            raw if isinstance(raw, datetime) else datetime.fromisoformat(str(raw))
+            for raw in columns["date"]
+        ]
+    except (TypeError, ValueError):
+        return None
+    race_ids = list(map(str, columns["race_id"]))
+    return [
+        RaceModel(*row)
+        for row in zip(
+            race_ids,
+            dates,
+            map(str, columns["course"]),
+            distances,
+            map(str, columns["ground"]),
+            map(str, columns["weather"]),
+            [list(race_to_horses.get(race_id, ())) for race_id in race_ids],
+        )
+    ]
+
+
+def _payoffs_from_columns(columns: ColumnData) -> List[PayoffModel] | None:
+    """Build payoff models column by column, or ``None`` if any check fails."""
+
+    if not _columns_complete(columns, PAYOFF_SCHEMA):
+        return None
+    try:
+        odds = list(map(float, columns["odds"]))
+        payouts = list(map(float, columns["payout"]))
+        if odds and (min(odds) <= 0 or min(payouts) < 0):
+            return None
+        combinations = list(map(_parse_combination, columns["combination"]))
+    except (TypeError, ValueError):
+        return None
+    return [
+        PayoffModel(*row)
+        for row in zip(
+            map(str, columns["race_id"]),
+            map(str, columns["bet_type"]),
+            combinations,
+            odds,
+            payouts,
+        )
+    ]
+
+
+def validate_and_build_horses(
+    data: Iterable[Mapping[str, Any]] | ColumnData,
+) -> List[HorseEntryModel]:
+    """Validate horse records and return Pydantic-style models.
+
+    ``data`` may also be a column mapping, which is checked column by column.
+    """
+
+    if isinstance(data, Mapping):
+        models = _horses_from_columns(data)
+        if models is not None:
+            return models
+        data = _column_records(data)
+    return _validate_and_build(
+        data, HORSE_ENTRY_SCHEMA, HorseEntryModel.model_validate, "Horse"
+    )
+
+
+def _validate_horse_chunk(
+    records: Sequence[Mapping[str, Any]], start: int
+) -> tuple[List[HorseEntryModel], list[Exception]]:
+    """Validate one chunk of horse records inside a worker process."""
+
+    try:
+        models = _validate_and_build(
+            records,
+            HORSE_ENTRY_SCHEMA,
+            HorseEntryModel.model_validate,
+            "Horse",
+            start=start,
+        )
+    except ModelValidationError as exc:
+        return [], exc.errors
+    return models, []
+
+
+def validate_and_build_horses_parallel(
+    data: Iterable[Mapping[str, Any]] | ColumnData,
+    *,
+    chunk_size: int = 10_000,
+    workers: int | None = None,
+) -> List[HorseEntryModel]:
+    """Validate horse records across a process pool in chunks of ``chunk_size``.
+
+    Inputs smaller than one chunk are validated in-process. Errors from every
+    chunk are merged into a single :class:`ModelValidationError`.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if isinstance(data, Mapping):
+        data = _column_records(data)
+    records = [dict(record) for record in data]
+    if len(records) <= chunk_size:
+        return validate_and_build_horses(records)
+    starts = range(0, len(records), chunk_size)
+    chunks = [records[start : start + chunk_size] for start in starts]
+    # Deferred: importing the process pool pulls in multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    horses: list[HorseEntryModel] = []
+    errors: list[Exception] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_validate_horse_chunk, chunks, starts)
+        for models, chunk_errors in results:
+            horses.extend(models)
+            errors.extend(chunk_errors)
     if errors:
         raise ModelValidationError("Invalid horse data", errors=errors)
     return horses
 
 
+def validate_and_build_horses_from_json(buffer: bytes | str) -> List[HorseEntryModel]:
+    """Decode a JSON array of horse records and validate it.
+
+    ``orjson`` is used for decoding when installed and the standard library
+    :mod:`json` module otherwise. Prefer this over ``json.load`` followed by
+    :func:`validate_and_build_horses`.
+    """
+
+    records = _json_loads(buffer)
+    if not isinstance(records, list):
+        raise ModelValidationError("Horse JSON payload must be an array of records")
+    return validate_and_build_horses(records)
+
+
+def validate_and_build_horses_stream(
+    handle: IO[bytes], *, prefix: str = "item"
+) -> List[HorseEntryModel]:
+    """Validate horse records streamed from a JSON file handle.
+
+    Records located at ``prefix`` (an ``ijson`` path such as ``"horses.item"``)
+    are validated one at a time so the full document is never held in memory.
+    """
+
+    ijson = _require_ijson()
+    return validate_and_build_horses(ijson.items(handle, prefix, use_float=True))
+
+
 def validate_and_build_races(
-    races: Iterable[Mapping[str, Any]],
+    races: Iterable[Mapping[str, Any]] | ColumnData,
     horses: Iterable[HorseEntryModel] | None = None,
 ) -> List[RaceModel]:
-    """Validate race records and attach horse models when provided."""
+    """Validate race records and attach horse models when provided.
+
+    ``races`` may also be a column mapping, which is checked column by column.
+    """
 
     race_to_horses: dict[str, list[HorseEntryModel]] = {}
     for horse in horses or []:
         race_to_horses.setdefault(horse.race_id, []).append(horse)
 
-    errors: list[Exception] = []
-    race_models: list[RaceModel] = []
-    for index, record in enumerate(races):
-        payload = dict(record)
-        missing = _missing_fields(payload, RACE_SCHEMA)
-        if missing:
-            errors.append(ValueError(f"Race record {index} missing fields: {', '.join(missing)}"))
-            continue
-        payload["horses"] = race_to_horses.get(payload["race_id"], [])
-        try:
-            race_models.append(RaceModel.model_validate(payload))
-        except ValidationError as exc:
-            errors.append(exc)
-    if errors:
-        raise ModelValidationError("Invalid race data", errors=errors)
-    return race_models
+    if isinstance(races, Mapping):
+        models = _races_from_columns(races, race_to_horses)
+        if models is not None:
+            return models
+        races = _column_records(races)
 
+    def attach_horses(record: Mapping[str, Any]) -> Mapping[str, Any]:
+        race_horses = race_to_horses.get(str(record["race_id"]))
+        if race_horses is None and "horses" not in record:
+            return record
+        return {**record, "horses": race_horses or []}
 
-def validate_and_build_payoffs(payoffs: Iterable[Mapping[str, Any]]) -> List[PayoffModel]:
-    """Validate payoff records and return models."""
+    return _validate_and_build(
+        races, RACE_SCHEMA, RaceModel.model_validate, "Race", attach_horses
+    )
 
-    errors: list[Exception] = []
-    payoff_models: list[PayoffModel] = []
-    for index, record in enumerate(payoffs):
-        payload = dict(record)
-        missing = _missing_fields(payload, PAYOFF_SCHEMA)
-        if missing:
-            errors.append(ValueError(f"Payoff record {index} missing fields: {', '.join(missing)}"))
-            continue
-        try:
-            payoff_models.append(PayoffModel.model_validate(payload))
-        except ValidationError as exc:
-            errors.append(exc)
-    if errors:
-        raise ModelValidationError("Invalid payoff data", errors=errors)
-    return payoff_models
+
+def validate_and_build_payoffs(
+    payoffs: Iterable[Mapping[str, Any]] | ColumnData,
+) -> List[PayoffModel]:
+    """Validate payoff records and return models.
+
+    ``payoffs`` may also be a column mapping, which is checked column by column.
+    """
+
+    if isinstance(payoffs, Mapping):
+        models = _payoffs_from_columns(payoffs)
+        if models is not None:
+            return models
+        payoffs = _column_records(payoffs)
+
+    return _validate_and_build(
+        payoffs, PAYOFF_SCHEMA, PayoffModel.model_validate, "Payoff"
+    )
 
 
 __all__ = [
@@ -370,6 +885,7 @@ __all__ = [
     "ModelValidationError",
     "Payoff",
     "PayoffModel",
+    "PayoffTable",
     "Race",
     "RaceModel",
     "ValidationError",
@@ -377,6 +893,9 @@ __all__ = [
     "to_domain_payoff",
     "to_domain_race",
     "validate_and_build_horses",
+    "validate_and_build_horses_from_json",
+    "validate_and_build_horses_parallel",
+    "validate_and_build_horses_stream",
     "validate_and_build_payoffs",
     "validate_and_build_races",
 ]
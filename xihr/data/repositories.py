@@ -2,14 +2,35 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
 from datetime import UTC, datetime, timedelta
 import csv
-import importlib
+import importlib.util
 import json
+import marshal
+import re
+from functools import partial
+from itertools import chain, zip_longest
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Literal, Sequence
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Sequence,
+)
 
 from .models import (
+    HORSE_ENTRY_SCHEMA,
+    PAYOFF_SCHEMA,
+    RACE_SCHEMA,
     Payoff,
     PayoffModel,
     Race,
@@ -22,6 +43,10 @@ from .models import (
 )
 
 
+WIN_BET_TYPES = frozenset({"win", "単勝"})
+"""Payoff bet types counted as wins in historical statistics."""
+
+
 class DataRepository(ABC):
     """Abstract base repository used by strategies and the engine."""
 
@@ -38,7 +63,7 @@ class DataRepository(ABC):
         """Return payoffs for a specific race."""
 
     @abstractmethod
-    def get_historical(self, horse_id: str) -> Dict[str, float]:
+    def get_historical(self, horse_id: str) -> Mapping[str, float]:
         """Return historical statistics for the given horse."""
 
     @abstractmethod
@@ -53,27 +78,88 @@ class SimulationDataRepository(DataRepository):
 
     def __init__(
         self,
-        races: Sequence[RaceModel],
+        races: Iterable[RaceModel],
         payoffs: Iterable[PayoffModel],
         *,
         payoff_publication_delay: timedelta | float | int = timedelta(minutes=10),
     ) -> None:
         """Initialise the repository with validated race and payoff models."""
 
-        self._race_models = list(races)
-        self._payoff_models = list(payoffs)
-
+        # Keys come from the domain objects, whose identifiers are interned.
         self._races: Dict[str, Race] = {
-            model.race_id: to_domain_race(model) for model in self._race_models
+            race.race_id: race for race in map(to_domain_race, races)
         }
-        self._payoffs_by_race: Dict[str, List[Payoff]] = {}
-        for payoff_model in self._payoff_models:
-            self._payoffs_by_race.setdefault(payoff_model.race_id, []).append(
-                to_domain_payoff(payoff_model)
-            )
+        self._races_sorted: tuple[Race, ...] = tuple(
+            sorted(self._races.values(), key=attrgetter("date"))
+        )
+        by_race: Dict[str, List[Payoff]] = {}
+        by_bet_type: Dict[str, List[Payoff]] = {}
+        by_horse: Dict[str, List[Payoff]] = {}
+        # Sources list payoffs race by race, so the race bucket is looked up
+        # once per run of equal race ids rather than once per payoff.
+        race_id: str | None = None
+        race_bucket: List[Payoff] = []
+        for payoff_model in payoffs:
+            payoff = to_domain_payoff(payoff_model)
+            if payoff.race_id is not race_id:
+                race_id = payoff.race_id
+                race_bucket = by_race.setdefault(race_id, [])
+            race_bucket.append(payoff)
+            by_bet_type.setdefault(payoff.bet_type, []).append(payoff)
+            for horse_id in dict.fromkeys(payoff.combination):
+                by_horse.setdefault(horse_id, []).append(payoff)
+        # Buckets are frozen into tuples so lookups can hand them out directly.
+        self._payoffs_by_race: Dict[str, tuple[Payoff, ...]] = _freeze(by_race)
+        self._payoffs_by_bet_type: Dict[str, tuple[Payoff, ...]] = _freeze(by_bet_type)
+        self._payoffs_by_horse: Dict[str, tuple[Payoff, ...]] = _freeze(by_horse)
         if isinstance(payoff_publication_delay, (int, float)):
             payoff_publication_delay = timedelta(minutes=float(payoff_publication_delay))
         self._payoff_delay: timedelta = payoff_publication_delay
+        race_times = {
+            race_id: _ensure_utc(race.date) for race_id, race in self._races.items()
+        }
+        self._publish_times: Dict[str, Dict[str, datetime]] = {
+            "race": race_times,
+            "payoff": {
+                race_id: race_time + self._payoff_delay
+                for race_id, race_time in race_times.items()
+            },
+        }
+
+        self._horse_columns: Dict[str, Any] = {
+            "race_id": [],
+            "horse_id": [],
+            "draw": array("l"),
+        }
+        for race in self._races_sorted:
+            for horse in race.horses:
+                self._horse_columns["race_id"].append(race.race_id)
+                self._horse_columns["horse_id"].append(horse.horse_id)
+                self._horse_columns["draw"].append(horse.draw)
+        starts_by_horse: Counter[str] = Counter(
+            horse_id
+            for _, horse_id in set(
+                zip(self._horse_columns["race_id"], self._horse_columns["horse_id"])
+            )
+        )
+        # Count each horse once per winning payoff in a single Counter pass.
+        wins_by_horse: Counter[str] = Counter(
+            chain.from_iterable(
+                dict.fromkeys(payoff.combination)
+                for bet_type in WIN_BET_TYPES
+                for payoff in self._payoffs_by_bet_type.get(bet_type, ())
+            )
+        )
+        self._historical: Dict[str, Mapping[str, float]] = {
+            horse_id: MappingProxyType(
+                {
+                    "starts": starts,
+                    "wins": wins_by_horse[horse_id],
+                    "win_rate": wins_by_horse[horse_id] / starts,
+                }
+            )
+            for horse_id, starts in starts_by_horse.items()
+        }
 
     @classmethod
     def from_csv(
@@ -84,26 +170,34 @@ class SimulationDataRepository(DataRepository):
         horses_file: str = "horses.csv",
         payoffs_file: str = "payoffs.csv",
         payoff_publication_delay: timedelta | float | int = timedelta(minutes=10),
+        cache: bool = False,
     ) -> "SimulationDataRepository":
-        """Create a repository from CSV files stored beneath ``base_path``."""
+        """Create a repository from CSV files stored beneath ``base_path``.
+
+        With ``cache`` enabled the parsed columns of each file are kept in a
+        binary cache next to it and reused until the CSV file changes.
+        """
 
         base = Path(base_path)
-        horses_rows = _load_csv(base / horses_file)
-        for row in horses_rows:
-            if "odds" in row and isinstance(row["odds"], str) and row["odds"]:
-                row["odds"] = json.loads(row["odds"])
-        races_rows = _load_csv(base / races_file)
-        payoffs_rows = _load_csv(base / payoffs_file)
-        for row in payoffs_rows:
-            row["combination"] = _parse_combination(str(row.get("combination", "")))
-            if "odds" in row and row["odds"] != "":
-                row["odds"] = float(row["odds"])
-            if "payout" in row and row["payout"] != "":
-                row["payout"] = float(row["payout"])
-
-        horses = validate_and_build_horses(horses_rows)
-        races = validate_and_build_races(races_rows, horses)
-        payoffs = validate_and_build_payoffs(payoffs_rows)
+        loaders: tuple[Callable[[Path], dict[str, list[Any]]], ...] = (
+            _load_horses_csv,
+            _load_csv,
+            _load_payoffs_csv,
+        )
+        if cache:
+            loaders = tuple(partial(_load_cached, load) for load in loaders)
+        horses_columns, races_columns, payoffs_columns = _load_csv_files(
+            tuple(
+                zip(
+                    loaders,
+                    (base / horses_file, base / races_file, base / payoffs_file),
+                )
+            )
+        )
+
+        horses = validate_and_build_horses(horses_columns)
+        races = validate_and_build_races(races_columns, horses)
+        payoffs = validate_and_build_payoffs(payoffs_columns)
         return cls(
             races,
             payoffs,
@@ -123,18 +217,17 @@ class SimulationDataRepository(DataRepository):
         """Create a repository from an Excel workbook."""
 
         workbook_path = Path(workbook)
-        horses_rows = _load_excel(workbook_path, horses_sheet)
-        for row in horses_rows:
-            if "odds" in row:
-                row["odds"] = _ensure_dict(row["odds"])
-        races_rows = _load_excel(workbook_path, races_sheet)
-        payoffs_rows = _load_excel(workbook_path, payoffs_sheet)
-        for row in payoffs_rows:
-            row["combination"] = _convert_combination(row.get("combination", ""))
-
-        horses = validate_and_build_horses(horses_rows)
-        races = validate_and_build_races(races_rows, horses)
-        payoffs = validate_and_build_payoffs(payoffs_rows)
+        horses_columns = _load_excel(workbook_path, horses_sheet)
+        _replace_column(horses_columns, "odds", _convert_odds_column)
+        races_columns = _load_excel(workbook_path, races_sheet)
+        payoffs_columns = _load_excel(workbook_path, payoffs_sheet)
+        _replace_column(
+            payoffs_columns, "combination", _convert_combination_column, default=""
+        )
+
+        horses = validate_and_build_horses(horses_columns)
+        races = validate_and_build_races(races_columns, horses)
+        payoffs = validate_and_build_payoffs(payoffs_columns)
         return cls(
             races,
             payoffs,
@@ -150,8 +243,14 @@ class SimulationDataRepository(DataRepository):
         horses_table: str = "horses",
         payoffs_table: str = "payoffs",
         payoff_publication_delay: timedelta | float | int = timedelta(minutes=10),
+        use_pandas: bool = False,
     ) -> "SimulationDataRepository":
-        """Create a repository backed by relational tables."""
+        """Create a repository backed by relational tables.
+
+        Tables are read through the raw DB-API cursor unless ``use_pandas`` is
+        set, in which case ``pandas.read_sql_table`` is used instead. Only the
+        columns the model schemas consume are selected.
+        """
 
         sql_engine = engine
         if isinstance(engine, str):
@@ -161,18 +260,32 @@ class SimulationDataRepository(DataRepository):
             sqlalchemy = importlib.import_module("sqlalchemy")
             sql_engine = sqlalchemy.create_engine(engine)
 
-        horses_rows = _load_table(sql_engine, horses_table)
-        for row in horses_rows:
-            if "odds" in row:
-                row["odds"] = _ensure_dict(row["odds"])
-        races_rows = _load_table(sql_engine, races_table)
-        payoffs_rows = _load_table(sql_engine, payoffs_table)
-        for row in payoffs_rows:
-            row["combination"] = _convert_combination(row.get("combination", ""))
-
-        horses = validate_and_build_horses(horses_rows)
-        races = validate_and_build_races(races_rows, horses)
-        payoffs = validate_and_build_payoffs(payoffs_rows)
+        horses_columns = _load_table(
+            sql_engine,
+            horses_table,
+            columns=HORSE_ENTRY_SCHEMA,
+            use_pandas=use_pandas,
+        )
+        _replace_column(horses_columns, "odds", _convert_odds_column)
+        races_columns = _load_table(
+            sql_engine,
+            races_table,
+            columns=(*RACE_SCHEMA, "horses"),
+            use_pandas=use_pandas,
+        )
+        payoffs_columns = _load_table(
+            sql_engine,
+            payoffs_table,
+            columns=PAYOFF_SCHEMA,
+            use_pandas=use_pandas,
+        )
+        _replace_column(
+            payoffs_columns, "combination", _convert_combination_column, default=""
+        )
+
+        horses = validate_and_build_horses(horses_columns)
+        races = validate_and_build_races(races_columns, horses)
+        payoffs = validate_and_build_payoffs(payoffs_columns)
         return cls(
             races,
             payoffs,
@@ -187,44 +300,57 @@ class SimulationDataRepository(DataRepository):
     def iter_races(self) -> Iterator[Race]:
         """Iterate through races in chronological order."""
 
-        return iter(sorted(self._races.values(), key=lambda race: race.date))
+        return iter(self._races_sorted)
+
+    def horse_columns(self) -> Mapping[str, Sequence[Any]]:
+        """Return a read-only columnar view of every horse entry.
+
+        Rows follow :meth:`iter_races` order, so each race's horses are
+        contiguous. Columns are ``race_id``, ``horse_id`` and ``draw``.
+        """
+
+        return MappingProxyType(self._horse_columns)
 
     def get_payoffs(self, race_id: str) -> Iterable[Payoff]:
         """Return payoffs for the given race identifier."""
 
-        return tuple(self._payoffs_by_race.get(race_id, ()))
+        return self._payoffs_by_race.get(race_id, ())
 
-    def get_historical(self, horse_id: str) -> Dict[str, float]:
-        """Compute simple win statistics for a horse across races."""
+    def get_payoffs_for_horse(
+        self, horse_id: str, bet_type: str | None = None
+    ) -> Iterable[Payoff]:
+        """Return payoffs whose combination includes ``horse_id``.
 
-        wins = 0
-        starts = 0
-        for race in self._races.values():
-            if race.get_horse(horse_id):
-                starts += 1
-        for race_payoffs in self._payoffs_by_race.values():
-            for payoff in race_payoffs:
-                if horse_id in payoff.combination and payoff.bet_type in {"win", "単勝"}:
-                    wins += 1
-        if starts == 0:
-            return {"starts": 0, "wins": 0, "win_rate": 0.0}
-        return {"starts": starts, "wins": wins, "win_rate": wins / starts}
+        When ``bet_type`` is given only payoffs with that exact bet type are
+        returned.
+        """
+
+        payoffs = self._payoffs_by_horse.get(horse_id, ())
+        if bet_type is None:
+            return payoffs
+        return tuple([payoff for payoff in payoffs if payoff.bet_type == bet_type])
+
+    def get_historical(self, horse_id: str) -> Mapping[str, float]:
+        """Return simple win statistics for a horse across races.
+
+        Statistics are computed once at construction and the same read-only
+        mapping is returned on every call.
+        """
+
+        return self._historical.get(horse_id, _EMPTY_HISTORICAL)
 
     def get_publish_time(
         self, race_id: str, data_type: Literal["race", "payoff"]
     ) -> datetime | None:
         """Return when a race or payoff becomes available in simulation."""
 
-        race = self.get_race(race_id)
-        if race is None:
-            return None
-        race_time = _ensure_utc(race.date)
-        if data_type == "race":
-            return race_time
-        if data_type == "payoff":
-            return race_time + self._payoff_delay
-        msg = f"Unsupported data type: {data_type}"
-        raise ValueError(msg)
+        publish_times = self._publish_times.get(data_type)
+        if publish_times is None:
+            if race_id not in self._races:
+                return None
+            msg = f"Unsupported data type: {data_type}"
+            raise ValueError(msg)
+        return publish_times.get(race_id)
 
 
 class LiveDataRepository(DataRepository):
@@ -235,17 +361,33 @@ class LiveDataRepository(DataRepository):
 
         self._races: Dict[str, Race] = {}
         self._payoffs: Dict[str, List[Payoff]] = {}
+        self._payoff_snapshots: Dict[str, tuple[Payoff, ...]] = {}
         self._publish_times: Dict[tuple[str, str], datetime] = {}
 
     def register_race(self, race: Race) -> None:
         """Insert or update a race entry."""
 
-        self._races[race.race_id] = race
+        self.register_races((race,))
+
+    def register_races(self, races: Iterable[Race]) -> None:
+        """Insert or update several race entries at once."""
+
+        self._races.update({race.race_id: race for race in races})
 
     def register_payoff(self, payoff: Payoff) -> None:
         """Register a payoff entry for later retrieval."""
 
-        self._payoffs.setdefault(payoff.race_id, []).append(payoff)
+        self.register_payoffs((payoff,))
+
+    def register_payoffs(self, payoffs: Iterable[Payoff]) -> None:
+        """Register a batch of payoffs, extending each race's list once."""
+
+        grouped: Dict[str, List[Payoff]] = {}
+        for payoff in payoffs:
+            grouped.setdefault(payoff.race_id, []).append(payoff)
+        for race_id, race_payoffs in grouped.items():
+            self._payoffs.setdefault(race_id, []).extend(race_payoffs)
+            self._payoff_snapshots.pop(race_id, None)
 
     def get_race(self, race_id: str) -> Race | None:
         """Return a registered live race if present."""
@@ -258,15 +400,25 @@ class LiveDataRepository(DataRepository):
         return iter(self._races.values())
 
     def get_payoffs(self, race_id: str) -> Iterable[Payoff]:
-        """Return payoffs that have been registered for the race."""
+        """Return payoffs that have been registered for the race.
 
-        return tuple(self._payoffs.get(race_id, ()))
+        The tuple handed out is cached until further payoffs are registered
+        for the race.
+        """
 
-    def get_historical(self, horse_id: str) -> Dict[str, float]:
+        snapshot = self._payoff_snapshots.get(race_id)
+        if snapshot is None:
+            payoffs = self._payoffs.get(race_id)
+            if payoffs is None:
+                return ()
+            snapshot = self._payoff_snapshots[race_id] = tuple(payoffs)
+        return snapshot
+
+    def get_historical(self, horse_id: str) -> Mapping[str, float]:
         """Return placeholder stats when historical data is unavailable."""
 
         # In live mode we may not have historical data. Provide empty stats.
-        return {"starts": 0, "wins": 0, "win_rate": 0.0}
+        return _EMPTY_HISTORICAL
 
     def register_publish_time(
         self, race_id: str, data_type: Literal["race", "payoff"], available_at: datetime
@@ -283,23 +435,255 @@ class LiveDataRepository(DataRepository):
         return self._publish_times.get((race_id, data_type))
 
 
+_FETCH_BATCH_SIZE = 10_000
+"""Number of rows requested per ``fetchmany`` call when reading SQL tables."""
+
+_PARALLEL_CSV_MIN_BYTES = 4 * 1024 * 1024
+"""Combined CSV size (roughly 50k rows) from which files are loaded in parallel."""
+
+_EMPTY_HISTORICAL: Mapping[str, float] = MappingProxyType(
+    {"starts": 0, "wins": 0, "win_rate": 0.0}
+)
+"""Statistics reported for horses without recorded starts."""
+
+_OPENPYXL_SUFFIXES = frozenset({".xlsx", ".xlsm"})
+"""Workbook formats streamed with openpyxl when it is installed."""
+
+_WHITESPACE = re.compile(r"\s")
+"""Matches any whitespace character."""
+
+_CSV_CACHE_SUFFIX = ".cache"
+"""Suffix appended to CSV file names for their parsed-column caches."""
+
+_MISSING = object()
+"""Sentinel distinguishing an omitted default from ``None``."""
+
+
+def _freeze(buckets: Dict[str, List[Payoff]]) -> Dict[str, tuple[Payoff, ...]]:
+    """Convert list-valued payoff buckets into immutable tuples."""
+
+    return {key: tuple(values) for key, values in buckets.items()}
+
+
 def _ensure_utc(moment: datetime) -> datetime:
     """Return a timezone-aware UTC datetime."""
 
-    if moment.tzinfo is None:
+    tz = moment.tzinfo
+    if tz is UTC:
+        return moment
+    if tz is None:
         return moment.replace(tzinfo=UTC)
     return moment.astimezone(UTC)
 
 
-def _load_csv(path: Path) -> list[dict[str, Any]]:
-    """Load a CSV file from ``path`` into a list of dictionaries."""
+def _load_csv(path: Path) -> dict[str, list[Any]]:
+    """Load a CSV file from ``path`` into a mapping of column name to values."""
 
     if not path.exists():
         msg = f"CSV file not found: {path}"
         raise FileNotFoundError(msg)
+    if importlib.util.find_spec("polars") is not None:
+        return _load_csv_polars(path)
+    if importlib.util.find_spec("pyarrow") is not None:
+        return _load_csv_pyarrow(path)
     with path.open("r", encoding="utf8") as handle:
-        reader = csv.DictReader(handle)
-        return [dict(row) for row in reader]
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return {}
+        rows = [row for row in reader if row]
+    return _rows_to_columns(header, rows)
+
+
+def _load_horses_csv(path: Path) -> dict[str, list[Any]]:
+    """Load the horses CSV and decode its JSON ``odds`` column."""
+
+    columns = _load_csv(path)
+    if "odds" in columns:
+        columns["odds"] = _decode_json_column(columns["odds"])
+    return columns
+
+
+def _load_payoffs_csv(path: Path) -> dict[str, list[Any]]:
+    """Load the payoffs CSV and parse its ``combination`` column."""
+
+    columns = _load_csv(path)
+    _replace_column(columns, "combination", _parse_combination_column, default="")
+    return columns
+
+
+def _parse_combination_column(values: list[Any]) -> list[tuple[str, ...]]:
+    """Parse a CSV combination column, splitting plain dash lists in bulk.
+
+    When one scan of the joined column finds no whitespace and no JSON
+    arrays, every cell is split directly; otherwise each cell goes through
+    :func:`_parse_combination`.
+    """
+
+    if all(type(value) is str for value in values):
+        joined = "".join(values)
+        if "[" not in joined and not _WHITESPACE.search(joined):
+            return [tuple(value.split("-")) if value else () for value in values]
+    return [_parse_combination(str(value)) for value in values]
+
+
+def _load_cached(
+    load: Callable[[Path], dict[str, list[Any]]], path: Path
+) -> dict[str, list[Any]]:
+    """Return ``load(path)``, reusing a marshal cache stored beside ``path``.
+
+    The cache records the loader name with the file's modification time and
+    size and is rebuilt whenever they no longer match. Unreadable caches are
+    ignored and failures to write one are not fatal.
+    """
+
+    if not path.exists():
+        msg = f"CSV file not found: {path}"
+        raise FileNotFoundError(msg)
+    stat = path.stat()
+    stamp = (load.__name__, stat.st_mtime_ns, stat.st_size)
+    cache_path = path.with_name(path.name + _CSV_CACHE_SUFFIX)
+    try:
+        cached_stamp, columns = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    else:
+        if cached_stamp == stamp:
+            return columns  # type: ignore[no-any-return]
+    columns = load(path)
+    partial_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        partial_path.write_bytes(marshal.dumps((stamp, columns)))
+        partial_path.replace(cache_path)
+    except (OSError, ValueError):
+        pass
+    return columns
+
+
+def _load_csv_files(
+    jobs: Sequence[tuple[Callable[[Path], dict[str, list[Any]]], Path]],
+) -> list[dict[str, list[Any]]]:
+    """Run each ``(loader, path)`` job, in worker processes for large inputs.
+
+    Loading is spread over one process per file once the combined size reaches
+    :data:`_PARALLEL_CSV_MIN_BYTES`; smaller inputs are read serially because
+    spawning workers would cost more than it saves. Validation stays in the
+    calling process so domain objects share its intern pools.
+    """
+
+    total = sum(path.stat().st_size for _, path in jobs if path.exists())
+    if len(jobs) < 2 or total < _PARALLEL_CSV_MIN_BYTES:
+        return [load(path) for load, path in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(load, path) for load, path in jobs]
+        return [future.result() for future in futures]
+
+
+def _rows_to_columns(
+    names: Sequence[str], rows: Sequence[Sequence[Any]]
+) -> dict[str, list[Any]]:
+    """Transpose ``rows`` into columns, padding short rows with ``None``."""
+
+    columns = zip_longest(*rows, fillvalue=None) if rows else ((),) * len(names)
+    return {name: list(values) for name, values in zip(names, columns)}
+
+
+def _load_csv_polars(path: Path) -> dict[str, list[Any]]:
+    """Load a CSV file with polars, keeping every cell as a string like :mod:`csv`."""
+
+    pl = importlib.import_module("polars")
+    try:
+        frame = pl.read_csv(
+            path,
+            infer_schema_length=0,
+            missing_utf8_is_empty_string=True,
+            encoding="utf8",
+        )
+    except pl.exceptions.NoDataError:
+        return {}
+    return frame.to_dict(as_series=False)  # type: ignore[no-any-return]
+
+
+def _load_csv_pyarrow(path: Path) -> dict[str, list[Any]]:
+    """Load a CSV file with pyarrow's multi-threaded reader, keeping strings."""
+
+    with path.open("r", encoding="utf8", newline="") as handle:
+        header = next(csv.reader(handle), None)
+    if header is None:
+        return {}
+    pa = importlib.import_module("pyarrow")
+    pa_csv = importlib.import_module("pyarrow.csv")
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+        ),
+    )
+    return table.to_pydict()  # type: ignore[no-any-return]
+
+
+def _decode_json_column(values: list[Any]) -> list[Any]:
+    """Decode a column of JSON documents with a single parser call.
+
+    The cells are joined into one JSON array so the C decoder runs once for
+    the whole column. Columns holding anything but non-empty strings, or
+    cells that do not decode to exactly one value each, are returned
+    unchanged for per-row handling during validation.
+    """
+
+    if not values or not all(isinstance(value, str) and value for value in values):
+        return values
+    try:
+        decoded = json.loads("[" + ",".join(values) + "]")
+    except ValueError:
+        return values
+    if len(decoded) != len(values):
+        return values
+    return decoded  # type: ignore[no-any-return]
+
+
+def _map_column(
+    columns: dict[str, list[Any]],
+    name: str,
+    convert: Callable[[Any], Any],
+    *,
+    default: Any = _MISSING,
+) -> None:
+    """Apply ``convert`` to every value of column ``name`` in place.
+
+    When the column is absent it is skipped, unless ``default`` is given, in
+    which case it is filled with converted ``default`` values.
+    """
+
+    def convert_values(values: list[Any]) -> list[Any]:
+        return [convert(value) for value in values]
+
+    _replace_column(columns, name, convert_values, default=default)
+
+
+def _replace_column(
+    columns: dict[str, list[Any]],
+    name: str,
+    convert_values: Callable[[list[Any]], list[Any]],
+    *,
+    default: Any = _MISSING,
+) -> None:
+    """Replace column ``name`` with ``convert_values`` applied to the whole column.
+
+    Missing columns are handled as in :func:`_map_column`.
+    """
+
+    if name in columns:
+        values = columns[name]
+    elif default is not _MISSING:
+        size = len(next(iter(columns.values()), ()))
+        values = [default] * size
+    else:
+        return
+    columns[name] = convert_values(values)
 
 
 def _require_pandas() -> Any:
@@ -311,23 +695,89 @@ def _require_pandas() -> Any:
     return importlib.import_module("pandas")
 
 
-def _load_excel(path: Path, sheet_name: str) -> list[dict[str, Any]]:
-    """Load an Excel sheet into a list of dictionaries."""
+def _load_excel(path: Path, sheet_name: str) -> dict[str, list[Any]]:
+    """Load an Excel sheet into a mapping of column name to values."""
 
     if not path.exists():
         msg = f"Excel workbook not found: {path}"
         raise FileNotFoundError(msg)
+    if (
+        path.suffix.lower() in _OPENPYXL_SUFFIXES
+        and importlib.util.find_spec("openpyxl") is not None
+    ):
+        return _load_excel_openpyxl(path, sheet_name)
     pd = _require_pandas()
     frame = pd.read_excel(path, sheet_name=sheet_name)
-    return frame.to_dict(orient="records")  # type: ignore[no-any-return]
+    return frame.to_dict(orient="list")  # type: ignore[no-any-return]
+
+
+def _load_excel_openpyxl(path: Path, sheet_name: str) -> dict[str, list[Any]]:
+    """Stream an Excel sheet with openpyxl's read-only reader.
+
+    Rows are read lazily instead of building the whole workbook in memory.
+    Blank cells load as ``None`` and fully blank rows are skipped.
+    """
+
+    openpyxl = importlib.import_module("openpyxl")
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in workbook.sheetnames:
+            msg = f"Worksheet named {sheet_name!r} not found in {path}"
+            raise ValueError(msg)
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return {}
+        body = [row for row in rows if any(value is not None for value in row)]
+    finally:
+        workbook.close()
+    return _rows_to_columns(header, body)
+
+
+def _load_table(
+    engine: Any,
+    table: str,
+    *,
+    columns: Sequence[str] | None = None,
+    use_pandas: bool = False,
+) -> dict[str, list[Any]]:
+    """Load a SQL table into a mapping of column name to values.
+
+    Rows are fetched in batches straight from the DB-API cursor behind the
+    SQLAlchemy ``engine``. ``use_pandas`` restores ``pandas.read_sql_table``,
+    which also applies pandas' type coercion. When ``columns`` is given only
+    those of them present in the table are selected.
+    """
+
+    selected = None if columns is None else _table_columns(engine, table, columns)
+    if use_pandas:
+        pd = _require_pandas()
+        frame = pd.read_sql_table(table, engine, columns=selected)
+        return frame.to_dict(orient="list")  # type: ignore[no-any-return]
+    quote = engine.dialect.identifier_preparer.quote
+    projection = ", ".join(map(quote, selected)) if selected else "*"
+    rows: list[Sequence[Any]] = []
+    with engine.connect() as connection:
+        cursor = connection.connection.cursor()
+        try:
+            cursor.arraysize = _FETCH_BATCH_SIZE
+            cursor.execute(f"SELECT {projection} FROM {quote(table)}")
+            names = [column[0] for column in cursor.description]
+            while batch := cursor.fetchmany():
+                rows.extend(batch)
+        finally:
+            cursor.close()
+    return _rows_to_columns(names, rows)
 
 
-def _load_table(engine: Any, table: str) -> list[dict[str, Any]]:
-    """Load an entire SQL table into a list of dictionaries."""
+def _table_columns(engine: Any, table: str, wanted: Sequence[str]) -> list[str]:
+    """Return the names in ``wanted`` that exist as columns of ``table``."""
 
-    pd = _require_pandas()
-    frame = pd.read_sql_table(table, engine)
-    return frame.to_dict(orient="records")  # type: ignore[no-any-return]
+    sqlalchemy = importlib.import_module("sqlalchemy")
+    existing = {
+        column["name"] for column in sqlalchemy.inspect(engine).get_columns(table)
+    }
+    return [name for name in wanted if name in existing]
 
 
 def _parse_combination(raw: str) -> tuple[str, ...]:
@@ -343,7 +793,7 @@ def _parse_combination(raw: str) -> tuple[str, ...]:
             msg = f"Invalid combination json: {raw}"
             raise ValueError(msg) from exc
         return tuple(str(item) for item in values)
-    return tuple(part.strip() for part in raw.split("-"))
+    return _split_combination(raw)
 
 
 def _convert_combination(raw: object) -> tuple[str, ...]:
@@ -352,11 +802,55 @@ def _convert_combination(raw: object) -> tuple[str, ...]:
     if isinstance(raw, (list, tuple)):
         return tuple(str(item) for item in raw)
     if isinstance(raw, str):
-        return tuple(part.strip() for part in raw.split("-"))
+        return _split_combination(raw)
     msg = f"Unsupported combination format: {raw!r}"
     raise ValueError(msg)
 
 
+def _split_combination(raw: str) -> tuple[str, ...]:
+    """Split a dash-separated combination into stripped runner ids.
+
+    Combinations of up to three runners, which cover every bet type, are
+    peeled off with :meth:`str.partition` to build the tuple directly;
+    longer ones fall back to :meth:`str.split`.
+    """
+
+    first, sep, rest = raw.partition("-")
+    if not sep:
+        return (first.strip(),)
+    second, sep, rest = rest.partition("-")
+    if not sep:
+        return (first.strip(), second.strip())
+    third, sep, _ = rest.partition("-")
+    if not sep:
+        return (first.strip(), second.strip(), third.strip())
+    return tuple([part.strip() for part in raw.split("-")])
+
+
+def _convert_combination_column(values: list[Any]) -> list[tuple[str, ...]]:
+    """Convert a column of combinations, splitting plain strings in bulk.
+
+    A single regex scan over the joined column checks that no cell needs
+    whitespace stripping, letting every cell be split without per-part
+    cleanup. Anything else goes through :func:`_convert_combination`.
+    """
+
+    if all(type(value) is str for value in values) and not _WHITESPACE.search(
+        "".join(values)
+    ):
+        return [tuple(value.split("-")) for value in values]
+    return [_convert_combination(value) for value in values]
+
+
+def _convert_odds_column(values: list[Any]) -> list[Any]:
+    """Convert a column of odds, decoding all-JSON columns in one parse."""
+
+    decoded = _decode_json_column(values)
+    if decoded is not values:
+        return decoded
+    return [_ensure_dict(value) for value in values]
+
+
 def _ensure_dict(raw: object) -> dict:
     """Ensure stored odds data is expressed as a dictionary."""
 
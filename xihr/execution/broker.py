@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 import itertools
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Dict, Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, List, Sequence, Tuple
 
 from ..core.events import BetConfirmationEvent
 from ..data.models import Payoff
 from ..data.repositories import DataRepository
-from ..strategy.risk import BetPosition, Portfolio
+from ..strategy.risk import BetPosition, BetStatus, Portfolio
 
 
 CANONICAL_BET_TYPES: Dict[str, set[str]] = {
@@ -29,14 +31,20 @@ ORDER_SENSITIVE = {"exacta", "trifecta_exact"}
 """Bet types where runner ordering matters when computing payoffs."""
 
 
+_ALIAS_TO_CANONICAL: Dict[str, str] = {
+    alias.lower(): canonical
+    for canonical, aliases in CANONICAL_BET_TYPES.items()
+    for alias in aliases
+}
+"""Reverse lookup from lower-cased alias to canonical bet type."""
+
+
+@lru_cache(maxsize=256)
 def canonical_bet_type(bet_type: str) -> str:
     """Normalize different representations of a bet type."""
 
     normalized = bet_type.lower()
-    for canonical, aliases in CANONICAL_BET_TYPES.items():
-        if normalized in {alias.lower() for alias in aliases}:
-            return canonical
-    return normalized
+    return _ALIAS_TO_CANONICAL.get(normalized, normalized)
 
 
 @dataclass(slots=True)
@@ -60,11 +68,21 @@ class PendingBet:
 class BettingRepository(ABC):
     """Base class for bet execution backends."""
 
-    def __init__(self, portfolio: Portfolio) -> None:
-        """Initialise the repository with a backing portfolio."""
+    def __init__(
+        self, portfolio: Portfolio, *, clock: Callable[[], datetime] | None = None
+    ) -> None:
+        """Initialise the repository with a backing portfolio.
+
+        ``clock`` supplies placement times for requests without ``placed_at``;
+        it defaults to the UTC wall clock.
+        """
 
         self.portfolio = portfolio
+        self._clock = clock or _utc_now
         self._counter = itertools.count(1)
+        self._pending_confirmations: Dict[str, PendingBet] = {}
+        # Stake held back for bets awaiting confirmation.
+        self._reserved = 0.0
 
     def next_bet_id(self) -> str:
         """Return a new unique bet identifier."""
@@ -76,6 +94,20 @@ class BettingRepository(ABC):
 
         return self.portfolio.bankroll()
 
+    def _pop_pending(self, bet_id: str) -> PendingBet:
+        """Remove a pending bet and release the cash reserved for it."""
+
+        pending = self._pending_confirmations.pop(bet_id, None)
+        if pending is None:
+            msg = f"Unknown pending bet id: {bet_id}"
+            raise KeyError(msg)
+        if self._pending_confirmations:
+            self._reserved -= pending.stake
+        else:
+            # Reset rather than subtract so float drift cannot accumulate.
+            self._reserved = 0.0
+        return pending
+
     def get_positions(self) -> List[BetPosition]:
         """Return all recorded positions."""
 
@@ -105,19 +137,25 @@ class BettingRepository(ABC):
 class SimulationBettingRepository(BettingRepository):
     """Betting repository that settles bets using simulation data."""
 
-    def __init__(self, portfolio: Portfolio, data_repository: DataRepository) -> None:
+    def __init__(
+        self,
+        portfolio: Portfolio,
+        data_repository: DataRepository,
+        *,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
         """Create a simulation repository backed by ``portfolio`` and data."""
 
-        super().__init__(portfolio)
+        super().__init__(portfolio, clock=clock)
         self._data_repository = data_repository
-        self._pending: Dict[str, List[BetPosition]] = {}
-        self._pending_confirmations: Dict[str, PendingBet] = {}
+        self._payoff_indexes: Dict[
+            str, Tuple[Iterable[Payoff], _PayoffIndex, _PlacePayoffs]
+        ] = {}
 
     def _available_cash(self) -> float:
         """Return available cash excluding amounts reserved for pending bets."""
 
-        reserved = sum(pending.stake for pending in self._pending_confirmations.values())
-        return self.portfolio.cash - reserved
+        return self.portfolio.cash - self._reserved
 
     def place_bet(
         self,
@@ -130,7 +168,7 @@ class SimulationBettingRepository(BettingRepository):
     ) -> BetConfirmationEvent:
         """Validate and reserve cash for a simulated bet request."""
 
-        placement_time = placed_at or datetime.now(UTC)
+        placement_time = placed_at or self._clock()
         combination = tuple(horse_ids)
         if stake <= 0:
             return BetConfirmationEvent(
@@ -166,6 +204,7 @@ class SimulationBettingRepository(BettingRepository):
             placed_at=placement_time,
         )
         self._pending_confirmations[bet_id] = pending
+        self._reserved += stake
         return BetConfirmationEvent(
             bet_id=bet_id,
             race_id=race_id,
@@ -179,11 +218,8 @@ class SimulationBettingRepository(BettingRepository):
     def confirm_bet(self, event: BetConfirmationEvent) -> BetPosition:
         """Persist an accepted simulated bet and track it for settlement."""
 
-        pending = self._pending_confirmations.pop(event.bet_id, None)
-        if pending is None:
-            msg = f"Unknown pending bet id: {event.bet_id}"
-            raise KeyError(msg)
-        position = self.portfolio.place_bet(
+        pending = self._pop_pending(event.bet_id)
+        return self.portfolio.place_bet(
             bet_id=pending.bet_id,
             race_id=pending.race_id,
             bet_type=pending.bet_type,
@@ -191,34 +227,53 @@ class SimulationBettingRepository(BettingRepository):
             stake=pending.stake,
             placed_at=pending.placed_at,
         )
-        self._pending.setdefault(position.race_id, []).append(position)
-        return position
 
     def settle_race(self, race_id: str) -> List[BetPosition]:
         """Settle all simulated bets for the given race identifier."""
 
-        payoffs = list(self._data_repository.get_payoffs(race_id))
+        index, place_payoffs = self._payoff_index(race_id)
         settled: List[BetPosition] = []
-        for position in self._pending.pop(race_id, []):
-            payout = _calculate_payout(position, payoffs)
+        for position in self.portfolio.positions_for_race(race_id):
+            if position.status != BetStatus.OPEN:
+                continue
+            payout = _calculate_payout(position, index, place_payoffs)
             settled.append(self.portfolio.settle_bet(position.bet_id, payout))
         return settled
 
+    def _payoff_index(self, race_id: str) -> Tuple[_PayoffIndex, _PlacePayoffs]:
+        """Return the settlement index for ``race_id``, built once per payoff set.
+
+        The engine settles a race after every confirmed bet, so the index is
+        reused for as long as the data repository hands back the same payoffs
+        object and rebuilt as soon as it returns a new one.
+        """
+
+        payoffs = self._data_repository.get_payoffs(race_id)
+        cached = self._payoff_indexes.get(race_id)
+        if cached is not None and cached[0] is payoffs:
+            return cached[1], cached[2]
+        index, place_payoffs = _index_payoffs(payoffs)
+        self._payoff_indexes[race_id] = (payoffs, index, place_payoffs)
+        return index, place_payoffs
+
 
 class LiveBettingRepository(BettingRepository):
     """Placeholder repository representing an external broker."""
 
-    def __init__(self, portfolio: Portfolio) -> None:
+    def __init__(
+        self, portfolio: Portfolio, *, clock: Callable[[], datetime] | None = None
+    ) -> None:
         """Initialise a repository that mimics live broker behaviour."""
 
-        super().__init__(portfolio)
-        self._pending_confirmations: Dict[str, PendingBet] = {}
+        super().__init__(portfolio, clock=clock)
+        # Guards reservations and confirmations when several strategies share
+        # the repository from different threads.
+        self._lock = threading.Lock()
 
     def _available_cash(self) -> float:
         """Return cash not yet reserved for submitted live bets."""
 
-        reserved = sum(pending.stake for pending in self._pending_confirmations.values())
-        return self.portfolio.cash - reserved
+        return self.portfolio.cash - self._reserved
 
     def place_bet(
         self,
@@ -231,7 +286,7 @@ class LiveBettingRepository(BettingRepository):
     ) -> BetConfirmationEvent:
         """Validate a live bet request and issue a confirmation."""
 
-        placement_time = placed_at or datetime.now(UTC)
+        placement_time = placed_at or self._clock()
         combination = tuple(horse_ids)
         if stake <= 0:
             return BetConfirmationEvent(
@@ -244,10 +299,25 @@ class LiveBettingRepository(BettingRepository):
                 accepted=False,
                 message=f"Stake must be positive, got {stake}",
             )
-        if stake > self._available_cash():
+
+        bet_id = self.next_bet_id()
+        # The cash check and the reservation happen under one lock so that
+        # concurrent requests cannot over-commit the bankroll.
+        with self._lock:
             available = self._available_cash()
+            if stake <= available:
+                self._pending_confirmations[bet_id] = PendingBet(
+                    bet_id=bet_id,
+                    race_id=race_id,
+                    bet_type=bet_type,
+                    combination=combination,
+                    stake=stake,
+                    placed_at=placement_time,
+                )
+                self._reserved += stake
+        if stake > available:
             return BetConfirmationEvent(
-                bet_id=self.next_bet_id(),
+                bet_id=bet_id,
                 race_id=race_id,
                 bet_type=bet_type,
                 combination=combination,
@@ -256,17 +326,6 @@ class LiveBettingRepository(BettingRepository):
                 accepted=False,
                 message=f"Insufficient cash to place bet (available {available:.2f})",
             )
-
-        bet_id = self.next_bet_id()
-        pending = PendingBet(
-            bet_id=bet_id,
-            race_id=race_id,
-            bet_type=bet_type,
-            combination=combination,
-            stake=stake,
-            placed_at=placement_time,
-        )
-        self._pending_confirmations[bet_id] = pending
         return BetConfirmationEvent(
             bet_id=bet_id,
             race_id=race_id,
@@ -286,48 +345,88 @@ class LiveBettingRepository(BettingRepository):
     def confirm_bet(self, event: BetConfirmationEvent) -> BetPosition:
         """Mark a confirmed bet as submitted to the external broker."""
 
-        pending = self._pending_confirmations.pop(event.bet_id, None)
-        if pending is None:
-            msg = f"Unknown pending bet id: {event.bet_id}"
-            raise KeyError(msg)
-        position = self.portfolio.place_bet(
-            bet_id=pending.bet_id,
-            race_id=pending.race_id,
-            bet_type=pending.bet_type,
-            combination=pending.combination,
-            stake=pending.stake,
-            placed_at=pending.placed_at,
-        )
-        position.status = "submitted"
-        return position
+        with self._lock:
+            pending = self._pop_pending(event.bet_id)
+            position = self.portfolio.place_bet(
+                bet_id=pending.bet_id,
+                race_id=pending.race_id,
+                bet_type=pending.bet_type,
+                combination=pending.combination,
+                stake=pending.stake,
+                placed_at=pending.placed_at,
+            )
+            return self.portfolio.set_status(position.bet_id, BetStatus.SUBMITTED)
 
 
-def _calculate_payout(position: BetPosition, payoffs: Iterable[Payoff]) -> float:
-    """Return the payout for ``position`` using the supplied ``payoffs``."""
+def _utc_now() -> datetime:
+    """Return the current wall-clock time in UTC."""
 
-    canonical = canonical_bet_type(position.bet_type)
+    return datetime.now(UTC)
+
+
+_PayoffIndex = Dict[Tuple[str, Hashable], Payoff]
+"""Payoffs keyed by canonical bet type and comparable combination key."""
+
+_PlacePayoffs = List[Tuple[frozenset[str], Payoff]]
+"""Place payoffs paired with the set of runners they pay out on."""
+
+
+def _index_payoffs(payoffs: Iterable[Payoff]) -> Tuple[_PayoffIndex, _PlacePayoffs]:
+    """Bucket ``payoffs`` for hash lookups during settlement.
+
+    Place payoffs match any subset of their runners, so they cannot be keyed
+    and are returned separately alongside their runner sets. For duplicate
+    keys the first payoff wins, matching the order in which payoffs were
+    previously scanned.
+    """
+
+    index: _PayoffIndex = {}
+    place_payoffs: _PlacePayoffs = []
     for payoff in payoffs:
-        payoff_type = canonical_bet_type(payoff.bet_type)
-        if canonical != payoff_type:
+        canonical = canonical_bet_type(payoff.bet_type)
+        if canonical == "place":
+            place_payoffs.append((frozenset(payoff.combination), payoff))
             continue
-        if _combinations_match(position.combination, payoff.combination, canonical):
-            return position.stake * payoff.odds
-    return 0.0
-
-
-def _combinations_match(
-    bet_combo: Sequence[str],
-    result_combo: Sequence[str],
-    canonical_type: str,
-) -> bool:
-    """Return whether the bet combination matches the payoff combination."""
-
-    if canonical_type in ORDER_SENSITIVE:
-        return tuple(bet_combo) == tuple(result_combo)
-    if canonical_type == "win":
-        return bet_combo and result_combo and bet_combo[0] == result_combo[0]
-    if canonical_type == "place":
-        return all(horse in result_combo for horse in bet_combo)
-    if canonical_type in {"quinella", "quinella_place", "bracket_quinella", "trifecta_box"}:
-        return set(bet_combo) == set(result_combo)
-    return set(bet_combo) == set(result_combo)
+        key = _combination_key(payoff.combination, canonical)
+        if key is not None:
+            index.setdefault((canonical, key), payoff)
+    return index, place_payoffs
+
+
+def _combination_key(combination: Sequence[str], canonical_type: str) -> Hashable:
+    """Return the key under which equal combinations of a bet type collide."""
+
+    return _COMBINATION_KEYS.get(canonical_type, frozenset)(combination)
+
+
+def _first_runner(combination: Sequence[str]) -> str | None:
+    """Return the winning runner of a combination, if any."""
+
+    return combination[0] if combination else None
+
+
+_COMBINATION_KEYS: Dict[str, Callable[[Sequence[str]], Hashable]] = {
+    "win": _first_runner,
+    **{bet_type: tuple for bet_type in ORDER_SENSITIVE},
+}
+"""Combination key builders per canonical bet type; others compare as sets."""
+
+
+def _calculate_payout(
+    position: BetPosition, index: _PayoffIndex, place_payoffs: _PlacePayoffs
+) -> float:
+    """Return the payout for ``position`` using payoffs from :func:`_index_payoffs`."""
+
+    canonical = canonical_bet_type(position.bet_type)
+    if canonical == "place":
+        # A place bet wins when all of its runners appear in the payoff.
+        runners = frozenset(position.combination)
+        for result, payoff in place_payoffs:
+            if runners <= result:
+                return position.stake * payoff.odds
+        return 0.0
+    key = _combination_key(position.combination, canonical)
+    payoff = index.get((canonical, key)) if key is not None else None
+    if payoff is None:
+        return 0.0
+    return position.stake * payoff.odds
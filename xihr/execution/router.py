@@ -27,9 +27,16 @@ class Throttle:
 
 
 def any_throttle_allows(throttles: Iterable[Throttle], now: datetime) -> bool:
-    """Return ``True`` if at least one throttle would allow execution."""
+    """Return ``True`` if at least one throttle allows execution at ``now``.
 
-    return any(throttle.allow(now) for throttle in throttles)
+    Every throttle is consulted, so each one that allows execution records
+    ``now`` as its last execution time.
+    """
+
+    allowed = False
+    for throttle in throttles:
+        allowed |= throttle.allow(now)
+    return allowed
 
 
 __all__ = ["Throttle", "any_throttle_allows"]
@@ -1,6 +1,6 @@
 """Strategy interfaces and reusable rule blocks."""
 
 from .base import BaseStrategy
-from .risk import BetPosition, Portfolio
+from .risk import BetPosition, BetStatus, Portfolio
 
-__all__ = ["BaseStrategy", "BetPosition", "Portfolio"]
+__all__ = ["BaseStrategy", "BetPosition", "BetStatus", "Portfolio"]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, time, timedelta
-from typing import Callable, Sequence
+from typing import Callable, Mapping, Sequence
 
 from ..core.engine import Engine
 from ..core.events import (
@@ -94,7 +94,7 @@ class BaseStrategy:
             available_at = self.engine.clock.now()
         return DataEvent(kind="race", race=race, available_at=available_at)
 
-    def get_historical(self, horse_id: str) -> dict[str, float]:
+    def get_historical(self, horse_id: str) -> Mapping[str, float]:
         """Return historical stats for a horse if the repository supports it."""
 
         if self.data_repository is None:
@@ -4,7 +4,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Dict, List, Sequence
+from enum import Enum
+from typing import Dict, List, Sequence, Tuple
+
+
+class BetStatus(str, Enum):
+    """Lifecycle states of a :class:`BetPosition`."""
+
+    OPEN = "open"
+    SETTLED = "settled"
+    SUBMITTED = "submitted"
 
 
 @dataclass(slots=True)
@@ -17,19 +26,19 @@ class BetPosition:
     """Race the bet is associated with."""
     bet_type: str
     """Type of wager placed."""
-    combination: Sequence[str]
+    combination: Tuple[str, ...]
     """Runners included in the wager."""
     stake: float
     """Stake committed to the bet."""
     placed_at: datetime
     """Timestamp the bet was placed."""
-    status: str = "open"
-    """Current status of the bet (open or settled)."""
+    status: BetStatus = BetStatus.OPEN
+    """Current status of the bet."""
     payout: float = 0.0
     """Payout received once the bet is settled."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """Simple bankroll tracker."""
 
@@ -39,6 +48,25 @@ class Portfolio:
     """Available cash not tied up in open bets."""
     positions: Dict[str, BetPosition] = field(default_factory=dict)
     """Mapping from bet identifier to position details."""
+    _open: Dict[str, BetPosition] = field(default_factory=dict, init=False, repr=False)
+    """Open positions keyed by bet identifier."""
+    _settled: Dict[str, BetPosition] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Settled positions keyed by bet identifier."""
+    _open_stake: float = field(default=0.0, init=False, repr=False)
+    """Running total of stake committed to open positions."""
+    _realized: float = field(default=0.0, init=False, repr=False)
+    """Running total of profit realized by settled positions."""
+    _positions_by_race: Dict[str, List[BetPosition]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Positions grouped by race identifier in placement order."""
+
+    def __post_init__(self) -> None:
+        for position in self.positions.values():
+            self._positions_by_race.setdefault(position.race_id, []).append(position)
+            self._track(position)
 
     @classmethod
     def create(cls, bankroll: float) -> "Portfolio":
@@ -74,6 +102,8 @@ class Portfolio:
         )
         self.cash -= stake
         self.positions[bet_id] = position
+        self._positions_by_race.setdefault(race_id, []).append(position)
+        self._track(position)
         return position
 
     def settle_bet(self, bet_id: str, payout: float) -> BetPosition:
@@ -83,32 +113,73 @@ class Portfolio:
         if position is None:
             msg = f"Unknown bet id: {bet_id}"
             raise KeyError(msg)
-        if position.status != "open":
+        if position.status != BetStatus.OPEN:
             msg = f"Bet {bet_id} already settled"
             raise ValueError(msg)
-        position.status = "settled"
+        self._untrack(position)
+        position.status = BetStatus.SETTLED
         position.payout = payout
         self.cash += payout
+        self._track(position)
         return position
 
+    def set_status(self, bet_id: str, status: BetStatus) -> BetPosition:
+        """Change the status of a bet while keeping the running totals in sync."""
+
+        position = self.positions.get(bet_id)
+        if position is None:
+            msg = f"Unknown bet id: {bet_id}"
+            raise KeyError(msg)
+        self._untrack(position)
+        position.status = status
+        self._track(position)
+        return position
+
+    def _untrack(self, position: BetPosition) -> None:
+        """Remove ``position`` from the status indexes and running totals."""
+
+        if self._open.pop(position.bet_id, None) is not None:
+            self._open_stake -= position.stake
+        elif self._settled.pop(position.bet_id, None) is not None:
+            self._realized -= position.payout - position.stake
+
+    def _track(self, position: BetPosition) -> None:
+        """Add ``position`` to the open or settled index and running totals."""
+
+        if position.status == BetStatus.OPEN:
+            self._open[position.bet_id] = position
+            self._open_stake += position.stake
+        elif position.status == BetStatus.SETTLED:
+            self._settled[position.bet_id] = position
+            self._realized += position.payout - position.stake
+
     def bankroll(self) -> float:
         """Return the current cash balance."""
 
         return self.cash
 
+    @property
+    def open_count(self) -> int:
+        """Return the number of positions that have not yet settled."""
+
+        return len(self._open)
+
+    def positions_for_race(self, race_id: str) -> List[BetPosition]:
+        """Return positions placed on ``race_id`` in placement order."""
+
+        return list(self._positions_by_race.get(race_id, ()))
+
     def open_positions(self) -> List[BetPosition]:
         """Return positions that have not yet settled."""
 
-        return [pos for pos in self.positions.values() if pos.status == "open"]
+        return list(self._open.values())
 
     def settled_positions(self) -> List[BetPosition]:
         """Return positions that have settled."""
 
-        return [pos for pos in self.positions.values() if pos.status == "settled"]
+        return list(self._settled.values())
 
     def total_profit(self) -> float:
         """Calculate the combined realized and unrealized profit."""
 
-        realized = sum(pos.payout - pos.stake for pos in self.settled_positions())
-        unrealized = -sum(pos.stake for pos in self.open_positions())
-        return realized + unrealized
+        return self._realized - self._open_stake
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable, Protocol, Sequence, TypeVar
 
-from .risk import BetPosition
+from .risk import BetPosition, BetStatus, Portfolio
 
 SignalT = TypeVar("SignalT")
 
@@ -16,11 +16,26 @@ class Rule(Protocol[SignalT]):
         """Return a possibly filtered or re-ordered sequence of ``signals``."""
 
 
-def limit_open_positions(positions: Iterable[BetPosition], max_open: int) -> bool:
-    """Return ``True`` if fewer than ``max_open`` positions are currently open."""
-
-    open_positions = sum(1 for position in positions if position.status == "open")
-    return open_positions < max_open
+def limit_open_positions(
+    positions: Iterable[BetPosition] | Portfolio, max_open: int
+) -> bool:
+    """Return ``True`` if fewer than ``max_open`` positions are currently open.
+
+    A :class:`Portfolio` answers from its open-position index; other iterables
+    are scanned only until ``max_open`` open positions have been seen.
+    """
+
+    if isinstance(positions, Portfolio):
+        return positions.open_count < max_open
+    if max_open <= 0:
+        return False
+    open_positions = 0
+    for position in positions:
+        if position.status == BetStatus.OPEN:
+            open_positions += 1
+            if open_positions >= max_open:
+                return False
+    return True
 
 
 __all__ = ["Rule", "limit_open_positions"]